@@ -6,270 +6,332 @@ import sys
 import os
 import platform
 
-print("=" * 70)
-print("VERIFICAÇÃO DE AMBIENTE - ORACLE 9i")
-print("=" * 70)
-print()
-
-# 1. Verificar Python
-print("1. PYTHON")
-print("-" * 70)
-print(f"   Versão: {sys.version}")
-print(f"   Executável: {sys.executable}")
-print(f"   Arquitetura: {platform.architecture()[0]}")
-
-python_version = sys.version_info
-if python_version.major == 3 and python_version.minor in [11, 12]:
-    print("   Status: ✓ Versão compatível com Oracle 9i")
-elif python_version.major == 3 and python_version.minor == 13:
-    print("   Status: ⚠️ Python 3.13 pode ter problemas com cx_Oracle 6.x")
-    print("   Recomendação: Use Python 3.11 ou 3.12")
-else:
-    print(f"   Status: ⚠️ Versão não testada para Oracle 9i")
-print()
-
-# 2. Verificar cx_Oracle
-print("2. CX_ORACLE")
-print("-" * 70)
+BAR = "=" * 70
+DASH = "-" * 70
+
+# Saída acumulada e escrita de uma só vez no final do script
+out = []
+
+
+def emit(line=""):
+    out.append(line)
+
+
+# Valores resolvidos uma única vez e reutilizados em todas as seções
+PY_VER = sys.version_info
+SYSTEM = platform.system()
+
 try:
-    import cx_Oracle
-    print(f"   Status: ✓ Instalado")
-    print(f"   Versão: {cx_Oracle.version}")
+    import cx_Oracle as _cxo
+    _cxo_error = None
+except ImportError:
+    _cxo = None
+    _cxo_error = None
+except Exception as e:
+    _cxo = None
+    _cxo_error = e
+
+cx_major_version = None
+if _cxo is not None:
+    try:
+        cx_major_str, _, _ = _cxo.version.partition('.')
+        cx_major_version = int(cx_major_str)
+    except Exception as e:
+        # Versão ilegível: tratada como falha na importação, sem abortar o diagnóstico
+        _cxo = None
+        _cxo_error = e
+
+# A saída acumulada é escrita mesmo se uma seção falhar no meio do diagnóstico
+try:
+    emit(BAR)
+    emit("VERIFICAÇÃO DE AMBIENTE - ORACLE 9i")
+    emit(BAR)
+    emit()
+
+    # 1. Verificar Python
+    emit("1. PYTHON")
+    emit(DASH)
+    emit(f"   Versão: {sys.version}")
+    emit(f"   Executável: {sys.executable}")
+    emit(f"   Arquitetura: {platform.architecture()[0]}")
+
+    PYTHON_STATUS = {
+        (3, 11): ("   Status: ✓ Versão compatível com Oracle 9i",),
+        (3, 12): ("   Status: ✓ Versão compatível com Oracle 9i",),
+        (3, 13): (
+            "   Status: ⚠️ Python 3.13 pode ter problemas com cx_Oracle 6.x",
+            "   Recomendação: Use Python 3.11 ou 3.12",
+        ),
+    }
+    for message in PYTHON_STATUS.get(PY_VER[:2], ("   Status: ⚠️ Versão não testada para Oracle 9i",)):
+        emit(message)
+    emit()
+
+    # 2. Verificar cx_Oracle
+    emit("2. CX_ORACLE")
+    emit(DASH)
+    if _cxo is not None:
+        emit(f"   Status: ✓ Instalado")
+        emit(f"   Versão: {_cxo.version}")
     
-    version_parts = cx_Oracle.version.split('.')
-    major_version = int(version_parts[0])
+        major_version = cx_major_version
     
-    if major_version == 6:
-        print("   Compatibilidade: ✓ Versão 6.x - COMPATÍVEL com Oracle 9i")
-    elif major_version == 5:
-        print("   Compatibilidade: ✓ Versão 5.x - COMPATÍVEL com Oracle 9i")
-    elif major_version >= 7:
-        print("   Compatibilidade: ✗ Versão 7.x+ - NÃO recomendada para Oracle 9i")
-        print("   Recomendação: pip install 'cx-Oracle>=6.0,<7.0'")
-    else:
-        print(f"   Compatibilidade: ⚠️ Versão {major_version}.x - não testada")
+        if major_version == 6:
+            emit("   Compatibilidade: ✓ Versão 6.x - COMPATÍVEL com Oracle 9i")
+        elif major_version == 5:
+            emit("   Compatibilidade: ✓ Versão 5.x - COMPATÍVEL com Oracle 9i")
+        elif major_version >= 7:
+            emit("   Compatibilidade: ✗ Versão 7.x+ - NÃO recomendada para Oracle 9i")
+            emit("   Recomendação: pip install 'cx-Oracle>=6.0,<7.0'")
+        else:
+            emit(f"   Compatibilidade: ⚠️ Versão {major_version}.x - não testada")
     
-    # Verificar se consegue obter versão do cliente
-    try:
-        client_version = cx_Oracle.clientversion()
-        print(f"   Oracle Client detectado: {'.'.join(map(str, client_version))}")
+        # Verificar se consegue obter versão do cliente
+        try:
+            client_version = _cxo.clientversion()
+            emit(f"   Oracle Client detectado: {'.'.join(map(str, client_version))}")
         
-        if client_version[0] == 11 and client_version[1] == 2:
-            print("   Oracle Client: ✓ Versão 11.2 - COMPATÍVEL com Oracle 9i")
-        elif client_version[0] <= 11:
-            print("   Oracle Client: ✓ Versão antiga - provavelmente compatível")
-        else:
-            print(f"   Oracle Client: ✗ Versão {client_version[0]}.{client_version[1]} - muito moderna para Oracle 9i")
-            print("   Recomendação: Use Oracle Client 11.2 ou anterior")
-    except Exception as e:
-        print(f"   Oracle Client: ✗ Não detectado ({e})")
-        print("   Recomendação: Configure ORACLE_9I_CLIENT_PATH ou PATH")
+            if client_version[0] == 11 and client_version[1] == 2:
+                emit("   Oracle Client: ✓ Versão 11.2 - COMPATÍVEL com Oracle 9i")
+            elif client_version[0] <= 11:
+                emit("   Oracle Client: ✓ Versão antiga - provavelmente compatível")
+            else:
+                emit(f"   Oracle Client: ✗ Versão {client_version[0]}.{client_version[1]} - muito moderna para Oracle 9i")
+                emit("   Recomendação: Use Oracle Client 11.2 ou anterior")
+        except Exception as e:
+            emit(f"   Oracle Client: ✗ Não detectado ({e})")
+            emit("   Recomendação: Configure ORACLE_9I_CLIENT_PATH ou PATH")
     
-except ImportError:
-    print("   Status: ✗ NÃO instalado")
-    print("   Solução: pip install 'cx-Oracle>=6.0,<7.0'")
-except Exception as e:
-    print(f"   Status: ✗ Erro ao importar: {e}")
-print()
-
-# 3. Verificar variáveis de ambiente
-print("3. VARIÁVEIS DE AMBIENTE")
-print("-" * 70)
-
-env_vars = [
-    'ORACLE_9I_CLIENT_PATH',
-    'ORACLE_CLIENT_PATH',
-    'ORACLE_HOME',
-    'PATH',
-    'LD_LIBRARY_PATH'  # Linux
-]
-
-for var in env_vars:
-    value = os.environ.get(var)
-    if value:
-        if var == 'PATH':
-            # Mostrar apenas paths relacionados a Oracle
-            oracle_paths = [p for p in value.split(os.pathsep) if 'oracle' in p.lower() or 'instant' in p.lower()]
-            if oracle_paths:
-                print(f"   {var} (Oracle paths):")
-                for path in oracle_paths:
-                    print(f"     - {path}")
+    elif _cxo_error is None:
+        emit("   Status: ✗ NÃO instalado")
+        emit("   Solução: pip install 'cx-Oracle>=6.0,<7.0'")
+    else:
+        emit(f"   Status: ✗ Erro ao importar: {_cxo_error}")
+    emit()
+
+    # 3. Verificar variáveis de ambiente
+    emit("3. VARIÁVEIS DE AMBIENTE")
+    emit(DASH)
+
+    env_vars = [
+        'ORACLE_9I_CLIENT_PATH',
+        'ORACLE_CLIENT_PATH',
+        'ORACLE_HOME',
+        'PATH',
+        'LD_LIBRARY_PATH'  # Linux
+    ]
+
+    for var in env_vars:
+        value = os.environ.get(var)
+        if value:
+            if var == 'PATH':
+                # Mostrar apenas paths relacionados a Oracle
+                oracle_paths = [
+                    p for p in value.split(os.pathsep)
+                    if 'oracle' in (lp := p.lower()) or 'instant' in lp
+                ]
+                if oracle_paths:
+                    emit(f"   {var} (Oracle paths):")
+                    for path in oracle_paths:
+                        emit(f"     - {path}")
+                else:
+                    emit(f"   {var}: (nenhum path Oracle encontrado)")
             else:
-                print(f"   {var}: (nenhum path Oracle encontrado)")
+                emit(f"   {var}: {value}")
         else:
-            print(f"   {var}: {value}")
+            if var in ['ORACLE_9I_CLIENT_PATH', 'ORACLE_CLIENT_PATH']:
+                emit(f"   {var}: ✗ NÃO configurada")
+            else:
+                emit(f"   {var}: (não configurada)")
+    emit()
+
+    # 4. Procurar por Oracle Instant Client
+    emit("4. ORACLE INSTANT CLIENT")
+    emit(DASH)
+
+    possible_locations = []
+
+    if SYSTEM == 'Windows':
+        possible_locations = [
+            r'C:\oracle\instantclient_11_2',
+            r'C:\oracle\instantclient_12_2',
+            r'C:\oracle\instantclient_19_3',
+            r'C:\oracle\instantclient_21_1',
+            r'D:\oracle\instantclient_11_2',
+            r'D:\oracle\instantclient_12_2',
+            r'D:\oracle\instantclient_19_3',
+            r'D:\oracle\instantclient_21_1',
+        ]
+    else:  # Linux/Mac
+        possible_locations = [
+            '/opt/oracle/instantclient_11_2',
+            '/opt/oracle/instantclient_12_2',
+            '/opt/oracle/instantclient_19_3',
+            '/opt/oracle/instantclient_21_1',
+            '/usr/lib/oracle/11.2/client64',
+            '/usr/lib/oracle/12.2/client64',
+            '/usr/lib/oracle/19.3/client64',
+            os.path.expanduser('~/oracle/instantclient_11_2'),
+            os.path.expanduser('~/oracle/instantclient_12_2'),
+        ]
+
+    if SYSTEM == 'Windows':
+        required_files = ['oci.dll', 'oraociei11.dll']
     else:
-        if var in ['ORACLE_9I_CLIENT_PATH', 'ORACLE_CLIENT_PATH']:
-            print(f"   {var}: ✗ NÃO configurada")
-        else:
-            print(f"   {var}: (não configurada)")
-print()
-
-# 4. Procurar por Oracle Instant Client
-print("4. ORACLE INSTANT CLIENT")
-print("-" * 70)
-
-possible_locations = []
-
-if platform.system() == 'Windows':
-    possible_locations = [
-        r'C:\oracle\instantclient_11_2',
-        r'C:\oracle\instantclient_12_2',
-        r'C:\oracle\instantclient_19_3',
-        r'C:\oracle\instantclient_21_1',
-        r'D:\oracle\instantclient_11_2',
-        r'D:\oracle\instantclient_12_2',
-        r'D:\oracle\instantclient_19_3',
-        r'D:\oracle\instantclient_21_1',
-    ]
-else:  # Linux/Mac
-    possible_locations = [
-        '/opt/oracle/instantclient_11_2',
-        '/opt/oracle/instantclient_12_2',
-        '/opt/oracle/instantclient_19_3',
-        '/opt/oracle/instantclient_21_1',
-        '/usr/lib/oracle/11.2/client64',
-        '/usr/lib/oracle/12.2/client64',
-        '/usr/lib/oracle/19.3/client64',
-        os.path.expanduser('~/oracle/instantclient_11_2'),
-        os.path.expanduser('~/oracle/instantclient_12_2'),
-    ]
+        required_files = ['libclntsh.so', 'libnnz11.so']
+
+    # Uma única leitura (os.scandir) por diretório pai, em vez de um stat por candidato;
+    # nomes comparados com os.path.normcase, que só ignora maiúsculas no Windows
+    # (C:\Oracle, OCI.DLL), como o os.path.exists de cada sistema
+    _dir_listings = {}
 
-found_clients = []
-for location in possible_locations:
-    if os.path.exists(location):
-        found_clients.append(location)
+
+    def list_dir(directory):
+        if directory not in _dir_listings:
+            try:
+                with os.scandir(directory) as entries:
+                    _dir_listings[directory] = {os.path.normcase(entry.name): entry for entry in entries}
+            except OSError:
+                _dir_listings[directory] = {}
+        return _dir_listings[directory]
+
+
+    found_clients = []
+    for location in possible_locations:
+        parent, name = os.path.split(location)
+        entry = list_dir(parent).get(os.path.normcase(name))
+        if entry is not None and entry.is_dir():
+            found_clients.append(location)
         
-        # Verificar arquivos importantes
-        if platform.system() == 'Windows':
-            required_files = ['oci.dll', 'oraociei11.dll']
-        else:
-            required_files = ['libclntsh.so', 'libnnz11.so']
+            # Verificar arquivos importantes
+            location_files = list_dir(location)
+            files_found = [file for file in required_files if os.path.normcase(file) in location_files]
         
-        files_found = []
-        for file in required_files:
-            file_path = os.path.join(location, file)
-            if os.path.exists(file_path):
-                files_found.append(file)
+            version = location.rsplit('_', 1)[-1] if '_' in location else 'desconhecida'
+            status = "✓ Completo" if len(files_found) == len(required_files) else "⚠️ Incompleto"
         
-        version = location.split('_')[-1] if '_' in location else 'desconhecida'
-        status = "✓ Completo" if len(files_found) == len(required_files) else "⚠️ Incompleto"
+            emit(f"   Encontrado: {location}")
+            emit(f"     Versão: {version}")
+            emit(f"     Status: {status}")
+            emit(f"     Arquivos: {', '.join(files_found) if files_found else 'nenhum arquivo crítico encontrado'}")
+            emit()
         
-        print(f"   Encontrado: {location}")
-        print(f"     Versão: {version}")
-        print(f"     Status: {status}")
-        print(f"     Arquivos: {', '.join(files_found) if files_found else 'nenhum arquivo crítico encontrado'}")
-        print()
-
-if not found_clients:
-    print("   ✗ Nenhum Oracle Instant Client encontrado nas localizações comuns")
-    print()
-    print("   Recomendação:")
-    print("   1. Baixe Oracle Instant Client 11.2:")
-    print("      https://www.oracle.com/database/technologies/instant-client/downloads.html")
-    if platform.system() == 'Windows':
-        print("   2. Extraia para: C:\\oracle\\instantclient_11_2")
+            # Cliente 11.2 completo é o recomendado; não é preciso procurar outros
+            if ('11_2' in location or '11.2' in location) and len(files_found) == len(required_files):
+                break
+
+    if not found_clients:
+        emit("   ✗ Nenhum Oracle Instant Client encontrado nas localizações comuns")
+        emit()
+        emit("   Recomendação:")
+        emit("   1. Baixe Oracle Instant Client 11.2:")
+        emit("      https://www.oracle.com/database/technologies/instant-client/downloads.html")
+        if SYSTEM == 'Windows':
+            emit("   2. Extraia para: C:\\oracle\\instantclient_11_2")
+        else:
+            emit("   2. Extraia para: /opt/oracle/instantclient_11_2")
+        emit()
     else:
-        print("   2. Extraia para: /opt/oracle/instantclient_11_2")
-    print()
-else:
-    # Verificar qual é o mais adequado
-    compatible_clients = [c for c in found_clients if '11_2' in c or '11.2' in c]
-    if compatible_clients:
-        print(f"   ✓ Cliente compatível encontrado: {compatible_clients[0]}")
-        print(f"   Recomendação: Configure ORACLE_9I_CLIENT_PATH={compatible_clients[0]}")
+        # Verificar qual é o mais adequado
+        compatible_clients = [c for c in found_clients if '11_2' in c or '11.2' in c]
+        if compatible_clients:
+            emit(f"   ✓ Cliente compatível encontrado: {compatible_clients[0]}")
+            emit(f"   Recomendação: Configure ORACLE_9I_CLIENT_PATH={compatible_clients[0]}")
+        else:
+            emit("   ⚠️ Nenhum cliente 11.2 encontrado (recomendado para Oracle 9i)")
+            if found_clients:
+                emit(f"   Clientes disponíveis: {', '.join(found_clients)}")
+                newer_clients = [c for c in found_clients if any(v in c for v in ['19_', '21_', '12_'])]
+                if newer_clients:
+                    emit(f"   ⚠️ Atenção: Clientes modernos ({', '.join(newer_clients)}) podem não funcionar com Oracle 9i")
+    emit()
+
+    # 5. Verificar arquivo .env
+    emit("5. ARQUIVO .ENV")
+    emit(DASH)
+
+    env_file = '.env'
+    if os.path.exists(env_file):
+        emit(f"   Status: ✓ Encontrado")
+        emit(f"   Localização: {os.path.abspath(env_file)}")
+        emit()
+        emit("   Conteúdo (credenciais ocultadas):")
+        with open(env_file, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        for raw_line in content.splitlines():
+            line = raw_line.strip()
+            if not line or line[0] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            if 'PASSWORD' in key.upper():
+                emit(f"     {key}=***")
+            else:
+                emit(f"     {key}={value}")
     else:
-        print("   ⚠️ Nenhum cliente 11.2 encontrado (recomendado para Oracle 9i)")
-        if found_clients:
-            print(f"   Clientes disponíveis: {', '.join(found_clients)}")
-            newer_clients = [c for c in found_clients if any(v in c for v in ['19_', '21_', '12_'])]
-            if newer_clients:
-                print(f"   ⚠️ Atenção: Clientes modernos ({', '.join(newer_clients)}) podem não funcionar com Oracle 9i")
-print()
-
-# 5. Verificar arquivo .env
-print("5. ARQUIVO .ENV")
-print("-" * 70)
-
-env_file = '.env'
-if os.path.exists(env_file):
-    print(f"   Status: ✓ Encontrado")
-    print(f"   Localização: {os.path.abspath(env_file)}")
-    print()
-    print("   Conteúdo (credenciais ocultadas):")
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    if 'PASSWORD' in key.upper():
-                        print(f"     {key}=***")
-                    else:
-                        print(f"     {key}={value}")
-else:
-    print(f"   Status: ✗ NÃO encontrado")
-    print()
-    print("   Recomendação: Crie um arquivo .env na raiz do projeto com:")
-    print()
-    print("   ORACLE_9I_DSN=ora9i_2:1521/MIGRAT")
-    print("   ORACLE_9I_USER=SINDU")
-    print("   ORACLE_9I_PASSWORD=sua_senha")
-    print("   ORACLE_9I_CLIENT_PATH=C:\\oracle\\instantclient_11_2")
-print()
-
-# 6. Resumo e recomendações
-print("=" * 70)
-print("RESUMO E RECOMENDAÇÕES")
-print("=" * 70)
-print()
-
-issues = []
-recommendations = []
-
-# Verificar Python
-if python_version.major == 3 and python_version.minor == 13:
-    issues.append("Python 3.13 pode ter incompatibilidades")
-    recommendations.append("Use Python 3.11 ou 3.12")
-
-# Verificar cx_Oracle
-try:
-    import cx_Oracle
-    version_parts = cx_Oracle.version.split('.')
-    major_version = int(version_parts[0])
-    if major_version >= 7:
-        issues.append(f"cx_Oracle {cx_Oracle.version} não recomendado para Oracle 9i")
+        emit(f"   Status: ✗ NÃO encontrado")
+        emit()
+        emit("   Recomendação: Crie um arquivo .env na raiz do projeto com:")
+        emit()
+        emit("   ORACLE_9I_DSN=ora9i_2:1521/MIGRAT")
+        emit("   ORACLE_9I_USER=SINDU")
+        emit("   ORACLE_9I_PASSWORD=sua_senha")
+        emit("   ORACLE_9I_CLIENT_PATH=C:\\oracle\\instantclient_11_2")
+    emit()
+
+    # 6. Resumo e recomendações
+    emit(BAR)
+    emit("RESUMO E RECOMENDAÇÕES")
+    emit(BAR)
+    emit()
+
+    issues = []
+    recommendations = []
+
+    # Verificar Python
+    if PY_VER[:2] == (3, 13):
+        issues.append("Python 3.13 pode ter incompatibilidades")
+        recommendations.append("Use Python 3.11 ou 3.12")
+
+    # Verificar cx_Oracle
+    if _cxo is not None:
+        if cx_major_version >= 7:
+            issues.append(f"cx_Oracle {_cxo.version} não recomendado para Oracle 9i")
+            recommendations.append("pip install 'cx-Oracle>=6.0,<7.0'")
+    else:
+        issues.append("cx_Oracle não instalado")
         recommendations.append("pip install 'cx-Oracle>=6.0,<7.0'")
-except:
-    issues.append("cx_Oracle não instalado")
-    recommendations.append("pip install 'cx-Oracle>=6.0,<7.0'")
-
-# Verificar Oracle Client
-if not found_clients:
-    issues.append("Nenhum Oracle Instant Client encontrado")
-    recommendations.append("Baixe e instale Oracle Instant Client 11.2")
-elif not any('11_2' in c or '11.2' in c for c in found_clients):
-    issues.append("Oracle Client 11.2 não encontrado")
-    recommendations.append("Instale Oracle Instant Client 11.2 para compatibilidade com Oracle 9i")
-
-# Verificar .env
-if not os.path.exists('.env'):
-    issues.append("Arquivo .env não encontrado")
-    recommendations.append("Crie arquivo .env com credenciais de conexão")
-
-if issues:
-    print("⚠️ PROBLEMAS ENCONTRADOS:")
-    for i, issue in enumerate(issues, 1):
-        print(f"   {i}. {issue}")
-    print()
-    print("📋 AÇÕES RECOMENDADAS:")
-    for i, rec in enumerate(recommendations, 1):
-        print(f"   {i}. {rec}")
-else:
-    print("✓✓✓ AMBIENTE PARECE ESTAR CONFIGURADO CORRETAMENTE!")
-    print()
-    print("Próximo passo:")
-    print("   python test_connection.py")
-
-print()
-print("=" * 70)
+
+    # Verificar Oracle Client
+    if not found_clients:
+        issues.append("Nenhum Oracle Instant Client encontrado")
+        recommendations.append("Baixe e instale Oracle Instant Client 11.2")
+    elif not any('11_2' in c or '11.2' in c for c in found_clients):
+        issues.append("Oracle Client 11.2 não encontrado")
+        recommendations.append("Instale Oracle Instant Client 11.2 para compatibilidade com Oracle 9i")
+
+    # Verificar .env
+    if not os.path.exists('.env'):
+        issues.append("Arquivo .env não encontrado")
+        recommendations.append("Crie arquivo .env com credenciais de conexão")
+
+    if issues:
+        emit("⚠️ PROBLEMAS ENCONTRADOS:")
+        for i, issue in enumerate(issues, 1):
+            emit(f"   {i}. {issue}")
+        emit()
+        emit("📋 AÇÕES RECOMENDADAS:")
+        for i, rec in enumerate(recommendations, 1):
+            emit(f"   {i}. {rec}")
+    else:
+        emit("✓✓✓ AMBIENTE PARECE ESTAR CONFIGURADO CORRETAMENTE!")
+        emit()
+        emit("Próximo passo:")
+        emit("   python test_connection.py")
+
+    emit()
+    emit(BAR)
+finally:
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
@@ -1,37 +1,61 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 from typing import Optional
 
 from dotenv import load_dotenv
 
 
-load_dotenv()
+def _load_env_file() -> None:
+    """
+    Carrega o .env do diret├│rio atual ou da raiz do projeto, sem a busca
+    recursiva do find_dotenv(). ORACLE_EXPORTER_SKIP_DOTENV=1 desativa a carga
+    (ex: processos filhos que j├í herdaram o ambiente).
+    """
+    if os.environ.get("ORACLE_EXPORTER_SKIP_DOTENV") == "1":
+        return
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for path in (".env", os.path.join(project_root, ".env")):
+        if os.path.isfile(path):
+            load_dotenv(path, override=False)
+            return
 
 
-@dataclass(frozen=True)
+_load_env_file()
+
+
+@dataclass(frozen=True, slots=True)
 class OracleConfig:
     dsn: str
     user: str
     password: str
     schema: Optional[str] = None
     client_path: Optional[str] = None
+    # Database link, criado no banco de destino, que aponta para este banco
+    # (usado pelo exporter para copiar os dados e pelo validator para comparar
+    # contagens e sin├┤nimos sem passar pelo cliente)
+    db_link: Optional[str] = None
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_env(prefix: str) -> "OracleConfig":
+        # Resultado memorizado por prefixo; use OracleConfig.from_env.cache_clear()
+        # se o ambiente for alterado durante a execu├º├úo
         env = prefix.upper()
-        dsn = os.environ.get(f"{env}_DSN")
-        user = os.environ.get(f"{env}_USER")
-        password = os.environ.get(f"{env}_PASSWORD")
+        env_get = os.environ.get
+        dsn = env_get(f"{env}_DSN")
+        user = env_get(f"{env}_USER")
+        password = env_get(f"{env}_PASSWORD")
         # Path espec├¡fico para este banco, ou fallback para path global
-        client_path = os.environ.get(f"{env}_CLIENT_PATH") or os.environ.get("ORACLE_CLIENT_PATH")
+        client_path = env_get(f"{env}_CLIENT_PATH") or env_get("ORACLE_CLIENT_PATH")
 
-        if not all([dsn, user, password]):
+        if not (dsn and user and password):
             missing = ", ".join(
-                name for name, value in [
+                name for name, value in (
                     (f"{env}_DSN", dsn),
                     (f"{env}_USER", user),
                     (f"{env}_PASSWORD", password),
-                ]
+                )
                 if not value
             )
             raise ValueError(f"Vari├íveis ausentes para {env}: {missing}")
@@ -40,22 +64,25 @@ class OracleConfig:
             dsn=dsn,
             user=user,
             password=password,
-            schema=os.environ.get(f"{env}_SCHEMA"),
+            schema=env_get(f"{env}_SCHEMA"),
             client_path=client_path,
+            db_link=env_get(f"{env}_DB_LINK"),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     source: OracleConfig
     target: OracleConfig
-    schemas: list[str]
+    schemas: tuple[str, ...]
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def load(schemas: Optional[str]) -> "ProjectConfig":
-        schema_list = []
-        if schemas:
-            schema_list = [part.strip().upper() for part in schemas.split(",") if part.strip()]
+        # Memorizado pela string de schemas, como OracleConfig.from_env; o .env
+        # ├® lido uma ├║nica vez na importa├º├úo do m├│dulo, ent├úo n├úo h├í arquivo a revalidar
+        parts = schemas.split(",") if schemas else ()
+        schema_list = tuple(name for name in (part.strip().upper() for part in parts) if name)
 
         return ProjectConfig(
             source=OracleConfig.from_env("ORACLE_11G"),
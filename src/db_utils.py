@@ -1,20 +1,110 @@
 from __future__ import annotations
 
+import atexit
 import os
 import logging
+import re
 import subprocess
+import sys
+import threading
+from collections import namedtuple
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, Iterator, Sequence
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Sequence
 
-import cx_Oracle
- 
 from .config import OracleConfig
 
+try:
+    from itertools import batched as _batched
+except ImportError:  # Python < 3.12
+    _batched = None
+
+if TYPE_CHECKING:
+    import cx_Oracle
+
 logger = logging.getLogger(__name__)
 
+
+def __getattr__(name: str) -> Any:
+    """
+    Importa o cx_Oracle sob demanda (PEP 562), evitando carregar as DLLs do
+    Oracle Client para quem usa apenas os helpers (ex: chunked).
+    """
+    if name == "cx_Oracle":
+        import cx_Oracle
+        globals()["cx_Oracle"] = cx_Oracle
+        return cx_Oracle
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Mensagens de ajuda para erros de conex├úo (formatadas com %s pelo logging)
+_DPI_1047_HELP = (
+    "Oracle Client n├úo encontrado. Configure uma das op├º├Áes:\n"
+    "1. Instale o Oracle Instant Client e adicione ao PATH do sistema\n"
+    "2. Defina a vari├ível de ambiente ORACLE_CLIENT_PATH com o caminho do Instant Client\n"
+    "   Exemplo: set ORACLE_CLIENT_PATH=C:\\oracle\\instantclient_11_2"
+)
+_ORA_3134_HELP = "\n".join([
+    "",
+    "=" * 70,
+    "ERRO: Vers├úo do Oracle Client incompat├¡vel!",
+    "=" * 70,
+    "",
+    "O banco de destino (Oracle 9i) requer Oracle Instant Client 11.2 ou anterior.",
+    "",
+    "DSN que falhou: %s",
+    "Usu├írio: %s",
+    "%s",
+    "",
+    "SOLU├ç├âO:",
+    "",
+    "1. Baixe e instale o Oracle Instant Client 11.2:",
+    "   https://www.oracle.com/database/technologies/instant-client/winx64-64-downloads.html",
+    "   Procure por: 'Instant Client for Microsoft Windows x64 (64-bit)' vers├úo 11.2",
+    "",
+    "2. Extraia para um diret├│rio (ex: C:\\oracle\\instantclient_11_2)",
+    "",
+    "3. Configure no arquivo .env:",
+    "   ORACLE_9I_CLIENT_PATH=C:\\oracle\\instantclient_11_2",
+    "",
+    "4. Reinicie o terminal/IDE ap├│s configurar",
+    "",
+    "=" * 70,
+])
+
+# Linhas buscadas por round-trip em consultas (o padr├úo do cx_Oracle ├® 100),
+# ajust├ível via ORACLE_QUERY_ARRAYSIZE
+QUERY_ARRAYSIZE = int(os.environ.get("ORACLE_QUERY_ARRAYSIZE", "5000"))
+
+# Nomes de colunas memorizados por banco e texto SQL (ver _column_names)
+COLUMN_CACHE_SIZE = 256
+_column_cache: dict[tuple[str | None, str | None, str], tuple[str, ...]] = {}
+
+# Statements mantidos no cache de cada sess├úo (o padr├úo do cx_Oracle ├® 20),
+# evitando novo parse no servidor para SQL repetido
+STATEMENT_CACHE_SIZE = 50
+
+# Limites de sess├Áes por pool (ajust├íveis via ORACLE_POOL_MIN/ORACLE_POOL_MAX)
+# e pools abertos por configura├º├úo de banco
+POOL_MIN_SESSIONS = int(os.environ.get("ORACLE_POOL_MIN", "1"))
+POOL_MAX_SESSIONS = int(os.environ.get("ORACLE_POOL_MAX", "8"))
+_pools: dict[OracleConfig, cx_Oracle.SessionPool] = {}
+# Cria├º├úo dos pools serializada: chamadas concorrentes (c├│pia paralela, --jobs)
+# n├úo podem abrir dois pools para o mesmo config
+_pools_lock = threading.Lock()
+
 # Cache de client paths j├í configurados para evitar reconfigura├º├úo
 _configured_client_paths: set[str] = set()
 
+# Entradas normalizadas do PATH, recalculadas apenas quando o PATH muda
+_path_entries_cache: tuple[str, set[str]] = ("", set())
+
+# init_oracle_client (cx_Oracle 8.0+) s├│ pode ser chamado uma vez por processo
+_client_lock = threading.Lock()
+_client_initialized = False
+
 
 def _configure_oracle_client(client_path: str | None) -> None:
     """
@@ -27,121 +117,338 @@ def _configure_oracle_client(client_path: str | None) -> None:
     if not client_path:
         return
     
-    # Se j├í foi configurado, n├úo precisa fazer novamente
-    if client_path in _configured_client_paths:
+    # Se j├í foi configurado, n├úo precisa fazer novamente (compara o path normalizado,
+    # ex: C:/oracle/x/ e C:\oracle\x s├úo o mesmo client)
+    path_key = os.path.normcase(os.path.normpath(client_path))
+    if path_key in _configured_client_paths:
         return
     
-    try:
-        # init_oracle_client est├í dispon├¡vel no cx_Oracle 8.0+
-        if hasattr(cx_Oracle, "init_oracle_client"):
-            cx_Oracle.init_oracle_client(lib_dir=client_path)
-            logger.info("Oracle Client configurado (cx_Oracle 8.0+): %s", client_path)
-            _configured_client_paths.add(client_path)
-        else:
-            # Para cx_Oracle 5.x, o client precisa estar no PATH do sistema
-            # Tentamos adicionar ao PATH do processo atual
-            import sys
-            if sys.platform == 'win32':
-                # No Windows, adiciona ao PATH do processo
-                current_path = os.environ.get('PATH', '')
-                if client_path not in current_path:
-                    os.environ['PATH'] = f"{client_path};{current_path}"
-                    logger.info("Oracle Client path adicionado ao PATH do processo (cx_Oracle 5.x): %s", client_path)
+    global _client_initialized, _path_entries_cache
+    import cx_Oracle
+    
+    with _client_lock:
+        # Outra thread pode ter configurado o mesmo path enquanto esper├ívamos
+        if path_key in _configured_client_paths:
+            return
+        
+        try:
+            # init_oracle_client est├í dispon├¡vel no cx_Oracle 8.0+
+            if hasattr(cx_Oracle, "init_oracle_client"):
+                if _client_initialized:
+                    logger.warning(
+                        "Oracle Client j├í inicializado neste processo; ignorando %s", client_path
+                    )
                 else:
-                    logger.info("Oracle Client path j├í est├í no PATH: %s", client_path)
+                    try:
+                        cx_Oracle.init_oracle_client(lib_dir=client_path)
+                        logger.info("Oracle Client configurado (cx_Oracle 8.0+): %s", client_path)
+                    except cx_Oracle.ProgrammingError as e:
+                        if "already been initialized" not in str(e):
+                            raise
+                        logger.warning("Oracle Client j├í inicializado neste processo; ignorando %s", client_path)
+                    _client_initialized = True
+                _configured_client_paths.add(path_key)
             else:
-                # Linux/Unix
+                # Para cx_Oracle 5.x, o client precisa estar no PATH do sistema
+                # Tentamos adicionar ao PATH do processo atual (";" no Windows, ":" no Linux/Unix)
                 current_path = os.environ.get('PATH', '')
-                if client_path not in current_path:
-                    os.environ['PATH'] = f"{client_path}:{current_path}"
+                path_entries = _path_entries(current_path)
+                if path_key not in path_entries:
+                    new_path = f"{client_path}{os.pathsep}{current_path}"
+                    os.environ['PATH'] = new_path
+                    path_entries.add(path_key)
+                    _path_entries_cache = (new_path, path_entries)
                     logger.info("Oracle Client path adicionado ao PATH do processo (cx_Oracle 5.x): %s", client_path)
                 else:
                     logger.info("Oracle Client path j├í est├í no PATH: %s", client_path)
-            
-            # Tamb├®m tenta configurar ORACLE_HOME se n├úo estiver definido
-            if not os.environ.get('ORACLE_HOME'):
-                os.environ['ORACLE_HOME'] = client_path
-                logger.info("ORACLE_HOME configurado: %s", client_path)
-            
-            _configured_client_paths.add(client_path)
-    except Exception as e:
-        logger.warning("Falha ao configurar Oracle Client (%s): %s", client_path, e)
+                
+                # Tamb├®m tenta configurar ORACLE_HOME se n├úo estiver definido
+                if not os.environ.get('ORACLE_HOME'):
+                    os.environ['ORACLE_HOME'] = client_path
+                    logger.info("ORACLE_HOME configurado: %s", client_path)
+                
+                _configured_client_paths.add(path_key)
+        except Exception as e:
+            logger.warning("Falha ao configurar Oracle Client (%s): %s", client_path, e)
+
+
+def _path_entries(current_path: str) -> set[str]:
+    """Conjunto de entradas normalizadas de current_path (reaproveitado se o PATH n├úo mudou)."""
+    global _path_entries_cache
+    
+    cached_path, entries = _path_entries_cache
+    if cached_path != current_path or not entries:
+        entries = {
+            os.path.normcase(os.path.normpath(entry))
+            for entry in current_path.split(os.pathsep)
+            if entry
+        }
+        _path_entries_cache = (current_path, entries)
+    return entries
+
+
+def _get_pool(config: OracleConfig) -> cx_Oracle.SessionPool:
+    """
+    Retorna o SessionPool do banco descrito por config, criando-o na primeira
+    chamada. Conex├Áes seguintes reaproveitam sess├Áes j├í autenticadas.
+    """
+    import cx_Oracle
+    
+    pool = _pools.get(config)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        # Outra thread pode ter criado o pool enquanto esper├ívamos
+        pool = _pools.get(config)
+        if pool is not None:
+            return pool
+        pool = cx_Oracle.SessionPool(
+            user=config.user,
+            password=config.password,
+            dsn=config.dsn,
+            min=POOL_MIN_SESSIONS,
+            max=max(POOL_MAX_SESSIONS, POOL_MIN_SESSIONS),
+            increment=1,
+            encoding="UTF-8",
+            threaded=True,
+            # Com todas as sess├Áes em uso (c├│pia paralela, --jobs), acquire
+            # espera uma ser devolvida em vez de falhar com ORA-24418
+            getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT,
+        )
+        _pools[config] = pool
+    return pool
+
+
+def close_pools() -> None:
+    """Fecha todos os SessionPools abertos por oracle_connection."""
+    while _pools:
+        _, pool = _pools.popitem()
+        try:
+            pool.close()
+        except Exception as e:
+            logger.warning("Falha ao fechar pool de conex├Áes: %s", e)
+
+
+# Sess├Áes dos pools s├úo encerradas quando o processo termina
+atexit.register(close_pools)
+
+
+def _log_client_not_found(config: OracleConfig, error: Any) -> None:
+    # DPI-1047: Cannot locate Oracle Client library
+    logger.error(_DPI_1047_HELP)
+
+
+def _log_unsupported_server(config: OracleConfig, error: Any) -> None:
+    # ORA-03134: Connections to this server version are no longer supported
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    if config.client_path:
+        client_status = (
+            f"Oracle Client Path configurado: {config.client_path}\n"
+            "ÔÜá Este caminho pode n├úo conter o Oracle Client 11.2 correto"
+        )
+    else:
+        client_status = "ÔÜá ORACLE_9I_CLIENT_PATH N├âO EST├ü CONFIGURADO!"
+    logger.error(_ORA_3134_HELP, config.dsn, config.user, client_status)
+
+
+def _log_invalid_credentials(config: OracleConfig, error: Any) -> None:
+    # ORA-01017: invalid username/password
+    logger.error("Credenciais inv├ílidas para %s@%s", config.user, config.dsn)
+
+
+def _log_no_listener(config: OracleConfig, error: Any) -> None:
+    # ORA-12541: TNS:no listener
+    logger.error("N├úo foi poss├¡vel conectar ao banco %s. Verifique se o servidor est├í acess├¡vel.", config.dsn)
+
+
+def _log_connect_error(config: OracleConfig, error: Any) -> None:
+    logger.error("Erro ao conectar ao banco %s: %s (c├│digo %s)", config.dsn, error.message, error.code)
+
+
+# Mensagens de oracle_connection por c├│digo de erro (demais c├│digos: _log_connect_error)
+_CONNECT_ERROR_HANDLERS: dict[int, Callable[[OracleConfig, Any], None]] = {
+    1047: _log_client_not_found,
+    3134: _log_unsupported_server,
+    1017: _log_invalid_credentials,
+    12541: _log_no_listener,
+}
+
+# Mensagens de test_connection por c├│digo de erro
+_TEST_ERROR_MESSAGES: dict[int, tuple[str, ...]] = {
+    1047: ("  ✗ Oracle Client n├úo encontrado", "     Configure ORACLE_CLIENT_PATH ou adicione ao PATH"),
+    1017: ("  ✗ Credenciais inv├ílidas",),
+    12541: ("  ✗ Listener n├úo encontrado - servidor pode estar inacess├¡vel",),
+    12514: ("  ✗ Servi├ºo n├úo conhecido pelo listener",),
+    3134: ("  ✗ Vers├úo do Oracle Client incompat├¡vel - tentando SQL*Plus nativo...",),
+}
 
 
 @contextmanager
 def oracle_connection(config: OracleConfig) -> Iterator[cx_Oracle.Connection]:
+    import cx_Oracle
+    
     # Configurar o Oracle Client espec├¡fico para esta conex├úo, se especificado
     if config.client_path:
         _configure_oracle_client(config.client_path)
     
     try:
-        connection = cx_Oracle.connect(
-            user=config.user,
-            password=config.password,
-            dsn=config.dsn,
-            encoding="UTF-8",
-        )
+        pool = _get_pool(config)
+        connection = pool.acquire()
     except cx_Oracle.DatabaseError as e:
         error, = e.args
-        if error.code == 1047:  # DPI-1047: Cannot locate Oracle Client library
-            logger.error(
-                "Oracle Client n├úo encontrado. Configure uma das op├º├Áes:\n"
-                "1. Instale o Oracle Instant Client e adicione ao PATH do sistema\n"
-                "2. Defina a vari├ível de ambiente ORACLE_CLIENT_PATH com o caminho do Instant Client\n"
-                "   Exemplo: set ORACLE_CLIENT_PATH=C:\\oracle\\instantclient_11_2"
-            )
-        elif error.code == 3134:  # ORA-03134: Connections to this server version are no longer supported
-            logger.error("")
-            logger.error("=" * 70)
-            logger.error("ERRO: Vers├úo do Oracle Client incompat├¡vel!")
-            logger.error("=" * 70)
-            logger.error("")
-            logger.error("O banco de destino (Oracle 9i) requer Oracle Instant Client 11.2 ou anterior.")
-            logger.error("")
-            logger.error("DSN que falhou: %s", config.dsn)
-            logger.error("Usu├írio: %s", config.user)
-            if config.client_path:
-                logger.error("Oracle Client Path configurado: %s", config.client_path)
-                logger.error("ÔÜá Este caminho pode n├úo conter o Oracle Client 11.2 correto")
-            else:
-                logger.error("ÔÜá ORACLE_9I_CLIENT_PATH N├âO EST├ü CONFIGURADO!")
-            logger.error("")
-            logger.error("SOLU├ç├âO:")
-            logger.error("")
-            logger.error("1. Baixe e instale o Oracle Instant Client 11.2:")
-            logger.error("   https://www.oracle.com/database/technologies/instant-client/winx64-64-downloads.html")
-            logger.error("   Procure por: 'Instant Client for Microsoft Windows x64 (64-bit)' vers├úo 11.2")
-            logger.error("")
-            logger.error("2. Extraia para um diret├│rio (ex: C:\\oracle\\instantclient_11_2)")
-            logger.error("")
-            logger.error("3. Configure no arquivo .env:")
-            logger.error("   ORACLE_9I_CLIENT_PATH=C:\\oracle\\instantclient_11_2")
-            logger.error("")
-            logger.error("4. Reinicie o terminal/IDE ap├│s configurar")
-            logger.error("")
-            logger.error("=" * 70)
-        elif error.code == 1017:  # ORA-01017: invalid username/password
-            logger.error("Credenciais inv├ílidas para %s@%s", config.user, config.dsn)
-        elif error.code == 12541:  # ORA-12541: TNS:no listener
-            logger.error("N├úo foi poss├¡vel conectar ao banco %s. Verifique se o servidor est├í acess├¡vel.", config.dsn)
-        else:
-            logger.error("Erro ao conectar ao banco %s: %s (c├│digo %s)", config.dsn, error.message, error.code)
+        _CONNECT_ERROR_HANDLERS.get(error.code, _log_connect_error)(config, error)
         raise
     except Exception as e:
         logger.error("Erro inesperado ao conectar ao banco %s: %s", config.dsn, e)
         raise
     
     try:
+        connection.stmtcachesize = STATEMENT_CACHE_SIZE
         yield connection
     finally:
-        connection.close()
+        pool.release(connection)
+
+
+def _tune_fetch(cursor: cx_Oracle.Cursor, arraysize: int = QUERY_ARRAYSIZE) -> None:
+    cursor.arraysize = arraysize
+    # prefetchrows s├│ existe no cx_Oracle 8.0+
+    if hasattr(cursor, "prefetchrows"):
+        cursor.prefetchrows = arraysize + 1
+
+
+def _column_names(cursor: cx_Oracle.Cursor, sql: str) -> tuple[str, ...]:
+    """
+    Nomes das colunas do resultado (internados), memorizados por banco (dsn e
+    usu├írio da conex├úo) e texto SQL para que consultas repetidas reutilizem as
+    mesmas chaves. A chave inclui o banco porque origem e destino podem
+    responder ├á mesma consulta (ex: SELECT *) com colunas diferentes; usar o
+    dsn em vez da conex├úo mant├®m o cache v├ílido entre sess├Áes do mesmo pool.
+    """
+    description = cursor.description
+    connection = cursor.connection
+    key = (getattr(connection, "dsn", None), getattr(connection, "username", None), sql)
+    columns = _column_cache.get(key)
+    if columns is None or len(columns) != len(description):
+        columns = tuple(map(sys.intern, map(itemgetter(0), description)))
+        if len(_column_cache) >= COLUMN_CACHE_SIZE:
+            _column_cache.clear()
+        _column_cache[key] = columns
+    return columns
+
+
+def execute_query(
+    connection: cx_Oracle.Connection,
+    sql: str,
+    params: Sequence[Any] | None = None,
+    arraysize: int = QUERY_ARRAYSIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Executa a consulta e entrega as linhas como dicts, buscadas em lotes de
+    arraysize (fetchmany), sem materializar o resultado inteiro.
+    A consulta s├│ ├® executada quando o iterador come├ºa a ser consumido, e o
+    cursor permanece aberto at├® ele ser esgotado ou fechado.
+    Use execute_query_list quando precisar de uma lista.
+    """
+    with connection.cursor() as cursor:
+        _tune_fetch(cursor, arraysize)
+        cursor.execute(sql, params or ())
+        columns = _column_names(cursor, sql)
+        while True:
+            rows = cursor.fetchmany(arraysize)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
 
 
-def execute_query(connection: cx_Oracle.Connection, sql: str, params: Sequence[Any] | None = None) -> list[Dict[str, Any]]:
+def execute_query_list(connection: cx_Oracle.Connection, sql: str, params: Sequence[Any] | None = None) -> list[Dict[str, Any]]:
+    return list(execute_query(connection, sql, params))
+
+
+def execute_query_rows(
+    connection: cx_Oracle.Connection,
+    sql: str,
+    params: Sequence[Any] | None = None,
+) -> tuple[tuple[str, ...], list[tuple]]:
+    """
+    Variante de execute_query que retorna (colunas, linhas) com as linhas como
+    tuplas do pr├│prio cursor, sem montar um dict por linha.
+    """
     with connection.cursor() as cursor:
-        cursor.execute(sql, params or [])
-        columns = [col[0] for col in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor]
+        _tune_fetch(cursor)
+        cursor.execute(sql, params or ())
+        columns = _column_names(cursor, sql)
+        return columns, cursor.fetchall()
+
+
+def execute_query_records(
+    connection: cx_Oracle.Connection,
+    sql: str,
+    params: Sequence[Any] | None = None,
+) -> list[tuple]:
+    """
+    Variante de execute_query que retorna namedtuples (acesso por row.COLUNA),
+    criadas via _make a partir das tuplas do cursor. Use row._asdict() quando
+    um dict for necess├írio.
+    """
+    columns, rows = execute_query_rows(connection, sql, params)
+    row_type = namedtuple("Row", columns, rename=True)
+    make = row_type._make
+    return [make(row) for row in rows]
+
+
+def fetch_columnar(
+    connection: cx_Oracle.Connection,
+    sql: str,
+    params: Sequence[Any] | None = None,
+) -> tuple[tuple[str, ...], list[list[Any]]]:
+    """
+    Variante de execute_query que retorna (colunas, dados) com os dados por
+    coluna: dados[i] cont├®m todos os valores da coluna colunas[i]. Para voltar
+    ao formato de linhas (ex: executemany no destino), use zip(*dados).
+    """
+    columns, rows = execute_query_rows(connection, sql, params)
+    if not rows:
+        return columns, [[] for _ in columns]
+    return columns, list(map(list, zip(*rows)))
+
+
+# Caracteres que exigem o clean_ddl completo em execute_non_query
+_DDL_NEEDS_CLEANING = re.compile(r"""[;'"\\]|[^\t\n\x20-\x7e]""")
+
+# Statements DML consecutivos por bloco an├┤nimo em execute_non_query
+DML_BLOCK_SIZE = 100
+_DML_START = re.compile(r"\s*(?:INSERT|UPDATE|DELETE|MERGE)\b", re.I)
+
+# Statements DDL consecutivos por bloco EXECUTE IMMEDIATE em execute_non_query;
+# statements maiores que um VARCHAR2 do PL/SQL s├úo executados isoladamente
+DDL_BLOCK_SIZE = 50
+_DDL_BLOCK_MAX_LENGTH = 32767
+
+
+class _DdlCharTable(dict):
+    """
+    Tabela para str.translate: mant├®m ASCII imprim├¡vel, tab e newline e troca
+    qualquer outro caractere por espa├ºo. Entradas expl├¡citas (BOM, CR) t├¬m
+    prioridade; os demais c├│digos s├úo resolvidos uma ├║nica vez.
+    """
+
+    def __missing__(self, code: int) -> int:
+        value = code if 32 <= code <= 126 or code in (9, 10) else 32
+        self[code] = value
+        return value
+
+
+_DDL_CHAR_TABLE = _DdlCharTable({0xFEFF: None, 0x200B: None, 0x0D: 0x0D})
+_DDL_BAD_CHARS = re.compile(r"[^\t\n\x20-\x7e]")
+
+# Tokens do DDL: escapes (\\x), literais entre aspas simples/duplas (possivelmente
+# n├úo terminados), ponto e v├¡rgula e trechos sem nenhum desses caracteres
+_DDL_TOKEN = re.compile(
+    r"""\\.?|'(?:[^'\\]|\\.?)*(?:'|\Z)|"(?:[^"\\]|\\.?)*(?:"|\Z)|;|[^;'"\\]+""",
+    re.S,
+)
 
 
 def clean_ddl(ddl: str) -> list[str]:
@@ -152,78 +459,45 @@ def clean_ddl(ddl: str) -> list[str]:
     if not ddl:
         return []
     
-    # Se for um objeto LOB, ler o conte├║do
-    if hasattr(ddl, "read"):
-        ddl = ddl.read()
-    
-    # Converter para string se necess├írio
-    ddl = str(ddl)
+    if not isinstance(ddl, str):
+        # Se for um objeto LOB, ler o conte├║do; sen├úo converter para string
+        ddl = ddl.read() if hasattr(ddl, "read") else ddl
+        ddl = str(ddl)
     
-    # Remover caracteres de controle e BOM
-    ddl = ddl.replace("\ufeff", "").replace("\u200b", "").replace("\r\n", "\n").replace("\r", "\n")
-    
-    # Remover caracteres n├úo-ASCII problem├íticos (manter apenas ASCII b├ísico e alguns especiais)
-    # Mas preservar strings literais
-    lines = ddl.split("\n")
-    cleaned_lines = []
-    for line in lines:
-        # Remover caracteres de controle exceto tab e newline
-        cleaned_line = "".join(c if (32 <= ord(c) <= 126) or c in ("\t", "\n") else " " for c in line)
-        cleaned_lines.append(cleaned_line)
-    ddl = "\n".join(cleaned_lines)
+    # Remover BOM/zero-width e trocar caracteres de controle e n├úo-ASCII por
+    # espa├ºo em uma ├║nica passada; CR ├® mantido para normalizar CRLF em seguida.
+    # DDL que j├í ├® s├│ ASCII imprim├¡vel (o caso comum) n├úo passa pelo translate.
+    if _DDL_BAD_CHARS.search(ddl) is not None:
+        ddl = ddl.translate(_DDL_CHAR_TABLE)
+        if "\r" in ddl:
+            ddl = ddl.replace("\r\n", "\n").replace("\r", "\n")
     
     # Dividir por ponto e v├¡rgula (mas manter dentro de strings)
-    statements = []
-    current_statement = ""
-    in_string = False
-    string_char = None
-    escape_next = False
-    
-    i = 0
-    while i < len(ddl):
-        char = ddl[i]
-        
-        if escape_next:
-            current_statement += char
-            escape_next = False
-            i += 1
-            continue
-        
-        if char == "\\":
-            escape_next = True
-            current_statement += char
-            i += 1
-            continue
-        
-        if char in ("'", '"'):
-            if not in_string:
-                in_string = True
-                string_char = char
-            elif char == string_char:
-                in_string = False
-                string_char = None
-            current_statement += char
-        elif not in_string and char == ";":
-            stmt = current_statement.strip()
-            if stmt and not stmt.isspace():
-                statements.append(stmt)
-            current_statement = ""
-        else:
-            current_statement += char
+    if "'" not in ddl and '"' not in ddl and "\\" not in ddl:
+        # Sem aspas nem escapes, todo ponto e v├¡rgula separa statements
+        statements = [stmt for stmt in (part.strip() for part in ddl.split(";")) if stmt]
+    else:
+        statements = []
+        current_statement: list[str] = []
+        for token in _DDL_TOKEN.findall(ddl):
+            if token == ";":
+                stmt = "".join(current_statement).strip()
+                if stmt and not stmt.isspace():
+                    statements.append(stmt)
+                current_statement = []
+            else:
+                current_statement.append(token)
         
-        i += 1
-    
-    # Adicionar ├║ltimo statement se n├úo terminou com ponto e v├¡rgula
-    if current_statement.strip():
-        statements.append(current_statement.strip())
+        # Adicionar ├║ltimo statement se n├úo terminou com ponto e v├¡rgula
+        last_statement = "".join(current_statement).strip()
+        if last_statement:
+            statements.append(last_statement)
     
     # Limpar cada statement
     cleaned_statements = []
     for stmt in statements:
         # Remover ponto e v├¡rgula no final e espa├ºos extras
         stmt = stmt.rstrip(";").strip()
-        # Remover caracteres de controle restantes
-        stmt = "".join(c for c in stmt if ord(c) >= 32 or c in ("\n", "\t"))
         if stmt:
             cleaned_statements.append(stmt)
     
@@ -235,41 +509,183 @@ def execute_non_query(connection: cx_Oracle.Connection, sql: str, params: Sequen
     Executa SQL sem retorno. Se o SQL contiver m├║ltiplos statements (separados por ;),
     executa cada um separadamente.
     """
+    import cx_Oracle
+    
     if params:
         # Se h├í par├ómetros, executar normalmente
         with connection.cursor() as cursor:
             cursor.execute(sql, params)
         connection.commit()
     else:
+        # Caminho r├ípido: um ├║nico statement j├í limpo (sem ponto e v├¡rgula interno,
+        # aspas, escapes ou caracteres fora do ASCII imprim├¡vel) dispensa o clean_ddl
+        stmt = sql.strip().rstrip(";").strip() if isinstance(sql, str) else ""
+        if stmt and _DDL_NEEDS_CLEANING.search(stmt) is None:
+            with connection.cursor() as cursor:
+                _execute_statement(cursor, stmt)
+            connection.commit()
+            return
+        
         # Se n├úo h├í par├ómetros, pode ser DDL - limpar e executar
-        statements = clean_ddl(sql)
+        statements = [stmt for stmt in clean_ddl(sql) if stmt.strip()]
         with connection.cursor() as cursor:
-            for stmt in statements:
-                if stmt.strip():
-                    try:
-                        cursor.execute(stmt)
-                    except cx_Oracle.DatabaseError as e:
-                        error, = e.args
-                        # Se for erro de sintaxe, tentar executar como est├í (pode ser necess├írio ponto e v├¡rgula)
-                        if error.code == 911:  # ORA-00911: invalid character
-                            # Tentar executar com ponto e v├¡rgula
-                            if not stmt.rstrip().endswith(";"):
-                                stmt = stmt + ";"
-                            cursor.execute(stmt)
-                        else:
-                            raise
+            for is_dml, group in groupby(statements, key=_is_dml):
+                group = list(group)
+                if len(group) == 1:
+                    _execute_statement(cursor, group[0])
+                elif is_dml:
+                    _execute_dml_blocks(cursor, group)
+                else:
+                    _execute_ddl_blocks(cursor, group)
         connection.commit()
 
 
+def _is_dml(stmt: str) -> bool:
+    return _DML_START.match(stmt) is not None
+
+
+def _execute_statement(cursor: cx_Oracle.Cursor, stmt: str) -> None:
+    import cx_Oracle
+    
+    try:
+        cursor.execute(stmt)
+    except cx_Oracle.DatabaseError as e:
+        error, = e.args
+        # Se for erro de sintaxe, tentar executar como est├í (pode ser necess├írio ponto e v├¡rgula)
+        if error.code == 911:  # ORA-00911: invalid character
+            # Tentar executar com ponto e v├¡rgula
+            if not stmt.rstrip().endswith(";"):
+                stmt = stmt + ";"
+            cursor.execute(stmt)
+        else:
+            raise
+
+
+def _execute_dml_blocks(cursor: cx_Oracle.Cursor, statements: list[str]) -> None:
+    """
+    Envia statements DML consecutivos em blocos an├┤nimos BEGIN ... END (um
+    round-trip por bloco). Se um bloco falhar, o Oracle desfaz o bloco inteiro
+    e os statements dele s├úo reexecutados um a um.
+    """
+    import cx_Oracle
+    
+    for batch in chunked(statements, DML_BLOCK_SIZE):
+        block = "BEGIN\n" + ";\n".join(batch) + ";\nEND;"
+        try:
+            cursor.execute(block)
+        except cx_Oracle.DatabaseError:
+            for stmt in batch:
+                _execute_statement(cursor, stmt)
+
+
+def _execute_ddl_blocks(cursor: cx_Oracle.Cursor, statements: list[str]) -> None:
+    """
+    Envia statements DDL consecutivos como EXECUTE IMMEDIATE em blocos an├┤nimos
+    (um round-trip por bloco). DDL faz commit impl├¡cito e n├úo pode ser desfeito,
+    ent├úo o bloco devolve quantos statements conclu├¡ram; a partir do primeiro
+    que falhou, os restantes s├úo executados um a um por _execute_statement
+    (mesmos erros e mesmo retry de ORA-00911 da execu├º├úo individual).
+    """
+    batch: list[str] = []
+    for stmt in statements:
+        if len(stmt) > _DDL_BLOCK_MAX_LENGTH:
+            _run_ddl_block(cursor, batch)
+            batch = []
+            _execute_statement(cursor, stmt)
+            continue
+        batch.append(stmt)
+        if len(batch) == DDL_BLOCK_SIZE:
+            _run_ddl_block(cursor, batch)
+            batch = []
+    _run_ddl_block(cursor, batch)
+
+
+def _run_ddl_block(cursor: cx_Oracle.Cursor, batch: list[str]) -> None:
+    if len(batch) < 2:
+        for stmt in batch:
+            _execute_statement(cursor, stmt)
+        return
+    
+    import cx_Oracle
+    
+    body = "".join(
+        f"  EXECUTE IMMEDIATE :s{i};\n  done := {i};\n" for i in range(1, len(batch) + 1)
+    )
+    block = (
+        "DECLARE\n  done PLS_INTEGER := 0;\nBEGIN\n" + body +
+        "  :executed := done;\nEXCEPTION\n  WHEN OTHERS THEN\n    :executed := done;\nEND;"
+    )
+    executed_var = cursor.var(int)
+    binds: dict[str, Any] = {f"s{i}": stmt for i, stmt in enumerate(batch, 1)}
+    binds["executed"] = executed_var
+    try:
+        cursor.execute(block, binds)
+        executed = executed_var.getvalue() or 0
+    except cx_Oracle.DatabaseError:
+        # Falha antes de executar qualquer statement (ex: parse do bloco)
+        executed = 0
+    for stmt in batch[executed:]:
+        _execute_statement(cursor, stmt)
+
+
+def execute_many(
+    connection: cx_Oracle.Connection,
+    sql: str,
+    rows: Iterable[Sequence[Any]],
+    batch_size: int = 1000,
+) -> int:
+    """
+    Executa o mesmo statement DML para v├írias linhas usando executemany,
+    em lotes de batch_size, com um commit por lote.
+    Retorna o total de linhas enviadas.
+    """
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.bindarraysize = batch_size
+        for batch in chunked(rows, batch_size):
+            cursor.executemany(sql, batch)
+            connection.commit()
+            total += len(batch)
+    return total
+
+
 def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
-    bucket: list[Any] = []
-    for item in iterable:
-        bucket.append(item)
-        if len(bucket) == size:
-            yield bucket
-            bucket = []
-    if bucket:
-        yield bucket
+    # Listas j├í materializadas s├úo fatiadas diretamente, sem percorrer item a item
+    if isinstance(iterable, list):
+        return (iterable[start:start + size] for start in range(0, len(iterable), size))
+    # itertools.batched (Python 3.12+) faz o agrupamento inteiro em C
+    if _batched is not None:
+        return map(list, _batched(iterable, size))
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, size)), [])
+
+
+# Locais comuns do SQL*Plus (s├│ existem no Windows)
+_SQLPLUS_PATHS = (
+    r"C:\ORAWIN95\bin\SQLPLUS.EXE",
+    r"C:\Oracle\bin\SQLPLUS.EXE",
+    r"C:\Oracle\product\11.2.0\client_1\bin\SQLPLUS.EXE",
+    r"C:\Oracle\product\10.2.0\client_1\bin\SQLPLUS.EXE",
+) if sys.platform == "win32" else ()
+
+# Script SQL simples para teste
+_SQLPLUS_SCRIPT = """SET HEADING OFF FEEDBACK OFF PAGESIZE 0 LINESIZE 32767
+SELECT * FROM v$version WHERE ROWNUM = 1;
+SELECT name FROM v$database;
+SELECT SYSDATE FROM DUAL;
+SELECT USER FROM DUAL;
+EXIT;
+"""
+_SQLPLUS_INPUT = _SQLPLUS_SCRIPT.encode("ascii")
+
+# Codifica├º├úo da sa├¡da do SQL*Plus (decodificada de uma vez ap├│s o processo terminar)
+_SQLPLUS_ENCODING = "cp1252" if sys.platform == "win32" else "utf-8"
+
+
+@lru_cache(maxsize=1)
+def _find_sqlplus() -> str | None:
+    """Primeiro SQL*Plus encontrado em _SQLPLUS_PATHS (procurado uma ├║nica vez)."""
+    return next((path for path in _SQLPLUS_PATHS if os.path.exists(path)), None)
 
 
 def test_connection_sqlplus(config: OracleConfig, label: str = "Banco") -> dict[str, Any]:
@@ -293,20 +709,7 @@ def test_connection_sqlplus(config: OracleConfig, label: str = "Banco") -> dict[
         "database_info": {},
     }
     
-    # Procura pelo SQL*Plus em locais comuns
-    sqlplus_paths = [
-        r"C:\ORAWIN95\bin\SQLPLUS.EXE",
-        r"C:\Oracle\bin\SQLPLUS.EXE",
-        r"C:\Oracle\product\11.2.0\client_1\bin\SQLPLUS.EXE",
-        r"C:\Oracle\product\10.2.0\client_1\bin\SQLPLUS.EXE",
-    ]
-    
-    sqlplus_exe = None
-    for path in sqlplus_paths:
-        if os.path.exists(path):
-            sqlplus_exe = path
-            break
-    
+    sqlplus_exe = _find_sqlplus()
     if not sqlplus_exe:
         result["error"] = {
             "code": None,
@@ -320,15 +723,6 @@ def test_connection_sqlplus(config: OracleConfig, label: str = "Banco") -> dict[
     # Prepara conex├úo em formato SQL*Plus: user/password@dsn
     connect_string = f"{config.user}/{config.password}@{config.dsn}"
     
-    # Script SQL simples para teste
-    sql_commands = """SET HEADING OFF FEEDBACK OFF PAGESIZE 0 LINESIZE 32767
-SELECT * FROM v$version WHERE ROWNUM = 1;
-SELECT name FROM v$database;
-SELECT SYSDATE FROM DUAL;
-SELECT USER FROM DUAL;
-EXIT;
-"""
-    
     try:
         logger.info("Testando conex├úo com %s usando SQL*Plus...", label)
         logger.info("  DSN: %s", config.dsn)
@@ -337,28 +731,28 @@ EXIT;
         # Executa SQL*Plus com input
         proc = subprocess.run(
             [sqlplus_exe, "-s", connect_string],
-            input=sql_commands,
+            input=_SQLPLUS_INPUT,
             capture_output=True,
-            text=True,
             timeout=30,
         )
         
-        output = proc.stdout.strip()
+        output = proc.stdout.decode(_SQLPLUS_ENCODING, "replace").strip()
+        stderr = proc.stderr.decode(_SQLPLUS_ENCODING, "replace")
         
         if proc.returncode != 0:
             result["error"] = {
                 "code": None,
-                "message": proc.stderr or "SQL*Plus retornou erro",
+                "message": stderr or "SQL*Plus retornou erro",
             }
             
-            if "ORA-01017" in proc.stderr:
+            if "ORA-01017" in stderr:
                 logger.error("  ✗ Credenciais inv├ílidas")
-            elif "ORA-12541" in proc.stderr:
+            elif "ORA-12541" in stderr:
                 logger.error("  ✗ Listener n├úo encontrado")
-            elif "TNS" in proc.stderr:
+            elif "TNS" in stderr:
                 logger.error("  ✗ Erro de conex├úo TNS")
             else:
-                logger.error("  ✗ Erro SQL*Plus: %s", proc.stderr[:200])
+                logger.error("  ✗ Erro SQL*Plus: %s", stderr[:200])
             
             return result
         
@@ -371,7 +765,8 @@ EXIT;
             return result
         
         # Parse dos resultados (simplificado)
-        lines = output.split('\n')
+        # S├│ as quatro primeiras linhas interessam; o restante fica sem dividir
+        lines = [line.strip() for line in output.split('\n', 4)[:4]]
         result["database_info"] = {
             "version": lines[0] if len(lines) > 0 else "Desconhecida",
             "database_name": lines[1] if len(lines) > 1 else "Desconhecido",
@@ -381,10 +776,16 @@ EXIT;
         
         result["success"] = True
         
-        logger.info("  ✓ Conex├úo estabelecida com sucesso via SQL*Plus!")
-        logger.info("  Vers├úo do Oracle: %s", result["database_info"]["version"][:50])
-        logger.info("  Nome do banco: %s", result["database_info"]["database_name"])
-        logger.info("  Usu├írio conectado: %s", result["database_info"]["current_user"])
+        if logger.isEnabledFor(logging.INFO):
+            database_info = result["database_info"]
+            logger.info(
+                "  ✓ Conex├úo estabelecida com sucesso via SQL*Plus!\n"
+                "  Vers├úo do Oracle: %s\n"
+                "  Nome do banco: %s\n"
+                "  Usu├írio conectado: %s",
+                database_info["version"][:50], database_info["database_name"],
+                database_info["current_user"],
+            )
         
     except subprocess.TimeoutExpired:
         result["error"] = {
@@ -401,6 +802,19 @@ EXIT;
     
     return result
 
+
+_CONNECTION_INFO_SQL = """
+    SELECT (SELECT banner FROM v$version WHERE banner LIKE 'Oracle%' AND ROWNUM = 1),
+           (SELECT instance_name FROM v$instance),
+           (SELECT host_name FROM v$instance),
+           (SELECT status FROM v$instance),
+           (SELECT name FROM v$database),
+           SYSDATE,
+           USER
+    FROM dual
+"""
+
+
 def test_connection(config: OracleConfig, label: str = "Banco") -> dict[str, Any]:
     """
     Testa a conex├úo com um banco Oracle e retorna informa├º├Áes sobre a conex├úo.
@@ -413,6 +827,8 @@ def test_connection(config: OracleConfig, label: str = "Banco") -> dict[str, Any
     Returns:
         Dicion├írio com informa├º├Áes da conex├úo e status
     """
+    import cx_Oracle
+    
     result = {
         "success": False,
         "label": label,
@@ -438,49 +854,40 @@ def test_connection(config: OracleConfig, label: str = "Banco") -> dict[str, Any
             dsn=config.dsn,
             encoding="UTF-8",
         )
+        connection.stmtcachesize = STATEMENT_CACHE_SIZE
         
         try:
             with connection.cursor() as cursor:
-                # Informa├º├Áes b├ísicas do banco
-                cursor.execute("SELECT * FROM v$version WHERE banner LIKE 'Oracle%'")
-                version_row = cursor.fetchone()
-                version = version_row[0] if version_row else "Desconhecida"
-                
-                cursor.execute("SELECT instance_name, host_name, status FROM v$instance")
-                instance_info = cursor.fetchone()
-                
-                cursor.execute("SELECT name FROM v$database")
-                db_name_row = cursor.fetchone()
-                db_name = db_name_row[0] if db_name_row else "Desconhecido"
-                
-                # Teste de query simples
-                cursor.execute("SELECT SYSDATE FROM DUAL")
-                sysdate = cursor.fetchone()[0]
-                
-                # Informa├º├Áes do usu├írio atual
-                cursor.execute("SELECT USER FROM DUAL")
-                current_user = cursor.fetchone()[0]
+                # Informa├º├Áes b├ísicas do banco, inst├óncia, data e usu├írio em um ├║nico round-trip
+                cursor.execute(_CONNECTION_INFO_SQL)
+                (version, instance_name, host_name, status, db_name, sysdate, current_user) = cursor.fetchone()
+                version = version or "Desconhecida"
+                db_name = db_name or "Desconhecido"
                 
                 result["database_info"] = {
                     "version": version,
                     "database_name": db_name,
-                    "instance_name": instance_info[0] if instance_info else "Desconhecido",
-                    "host_name": instance_info[1] if instance_info else "Desconhecido",
-                    "status": instance_info[2] if instance_info else "Desconhecido",
+                    "instance_name": instance_name or "Desconhecido",
+                    "host_name": host_name or "Desconhecido",
+                    "status": status or "Desconhecido",
                     "current_user": current_user,
                     "server_date": str(sysdate),
                 }
                 
                 result["success"] = True
                 
-                logger.info("  ✓ Conex├úo estabelecida com sucesso!")
-                logger.info("  Vers├úo do Oracle: %s", version)
-                logger.info("  Nome do banco: %s", db_name)
-                logger.info("  Inst├óncia: %s", instance_info[0] if instance_info else "N/A")
-                logger.info("  Host: %s", instance_info[1] if instance_info else "N/A")
-                logger.info("  Status: %s", instance_info[2] if instance_info else "N/A")
-                logger.info("  Usu├írio conectado: %s", current_user)
-                logger.info("  Data do servidor: %s", sysdate)
+                logger.info(
+                    "  ✓ Conex├úo estabelecida com sucesso!\n"
+                    "  Vers├úo do Oracle: %s\n"
+                    "  Nome do banco: %s\n"
+                    "  Inst├óncia: %s\n"
+                    "  Host: %s\n"
+                    "  Status: %s\n"
+                    "  Usu├írio conectado: %s\n"
+                    "  Data do servidor: %s",
+                    version, db_name, instance_name or "N/A", host_name or "N/A",
+                    status or "N/A", current_user, sysdate,
+                )
                 
         finally:
             connection.close()
@@ -493,21 +900,15 @@ def test_connection(config: OracleConfig, label: str = "Banco") -> dict[str, Any
             "message": error.message,
         }
         
-        if error.code == 1047:  # DPI-1047: Cannot locate Oracle Client library
-            logger.error("  ✗ Oracle Client n├úo encontrado")
-            logger.error("     Configure ORACLE_CLIENT_PATH ou adicione ao PATH")
-        elif error.code == 1017:  # ORA-01017: invalid username/password
-            logger.error("  ✗ Credenciais inv├ílidas")
-        elif error.code == 12541:  # ORA-12541: TNS:no listener
-            logger.error("  ✗ Listener n├úo encontrado - servidor pode estar inacess├¡vel")
-        elif error.code == 12514:  # ORA-12514: TNS:listener does not currently know of service
-            logger.error("  ✗ Servi├ºo n├úo conhecido pelo listener")
-        elif error.code == 3134:  # ORA-03134: Connections to this server version are no longer supported
-            logger.error("  ✗ Vers├úo do Oracle Client incompat├¡vel - tentando SQL*Plus nativo...")
+        messages = _TEST_ERROR_MESSAGES.get(error.code)
+        if messages is None:
+            logger.error("  ✗ Erro de conex├úo: %s (c├│digo %s)", error.message, error.code)
+        else:
+            for message in messages:
+                logger.error(message)
+        if error.code == 3134:
             # Tentar usar SQL*Plus para 9i
             return test_connection_sqlplus(config, label)
-        else:
-            logger.error("  ✗ Erro de conex├úo: %s (c├│digo %s)", error.message, error.code)
             
     except Exception as e:
         result["error"] = {
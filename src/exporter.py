@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator
 
 import cx_Oracle
 
 from .config import OracleConfig
-from .db_utils import chunked, execute_non_query, oracle_connection
+from .db_utils import clean_ddl, execute_non_query, oracle_connection
 
 
 logger = logging.getLogger(__name__)
@@ -15,15 +22,218 @@ logger.setLevel(logging.INFO)
 # Para Oracle 9i, usar PACKAGE_BODY (com underscore) ao inv├®s de "PACKAGE BODY"
 DDL_OBJECTS = ["TABLE", "VIEW", "SYNONYM", "TRIGGER", "PROCEDURE", "FUNCTION", "PACKAGE", "PACKAGE_BODY"]
 
+# Linhas (objetos) buscadas por round-trip na consulta de DDL
+DDL_FETCH_ARRAYSIZE = 500
+
+# Linhas por round-trip nas consultas de cat├ílogo (all_tables, all_source)
+CATALOG_FETCH_ARRAYSIZE = 5000
+
+# Tipos cujo DDL de um ├║nico statement ├® aplicado em blocos de EXECUTE IMMEDIATE
+# (DDL_BATCH_SIZE objetos por round-trip); os que falham seguem o caminho normal
+BATCHED_DDL_OBJECTS = ("VIEW", "SYNONYM", "TRIGGER")
+DDL_BATCH_SIZE = 50
+_MAX_BATCHED_DDL_LENGTH = 32767
+
+# M├¡nimo de linhas buscadas por round-trip na leitura dos dados (ver _fetch_rows)
+DATA_FETCH_ARRAYSIZE = 1000
+
+# Lote sem --batch-size: DEFAULT_BATCH_SIZE linhas no m├¡nimo, ou o que couber em
+# BATCH_TARGET_BYTES pela largura da linha (ver _batch_size_for), at├® MAX_BATCH_SIZE
+DEFAULT_BATCH_SIZE = 500
+BATCH_TARGET_BYTES = 16 * 1024 * 1024
+MAX_BATCH_SIZE = 20000
+LOB_ESTIMATED_BYTES = 4096
+
+# Menor lote do ajuste autom├ítico (--batch-size auto, ver AdaptiveBatchSize)
+ADAPTIVE_MIN_BATCH_SIZE = 50
+
+# Lotes lidos da origem que podem aguardar inser├º├úo no destino (ver _stream_rows)
+PIPELINE_DEPTH = 4
+_END_OF_ROWS = object()
+
+# DDL de todos os tipos de DDL_OBJECTS em uma ├║nica consulta; no all_objects o tipo
+# do package body ├® "PACKAGE BODY" (com espa├ºo), nome aceito tamb├®m pelo GET_DDL
+_DDL_QUERY = """
+    SELECT object_type, object_name, dbms_metadata.get_ddl(object_type => object_type, name => object_name, schema => owner) ddl
+    FROM all_objects
+    WHERE owner = :owner
+      AND object_type IN ({types})
+      AND generated = 'N'
+    ORDER BY object_type, object_name
+""".format(types=", ".join("'%s'" % object_type.replace("_", " ") for object_type in DDL_OBJECTS))
+
+
+# Transforma├º├Áes de sess├úo do DBMS_METADATA e abertura de _DDL_QUERY em um round-trip
+_DDL_BLOCK = """
+    BEGIN
+        DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'STORAGE', FALSE);
+        DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SEGMENT_ATTRIBUTES', FALSE);
+        DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SQLTERMINATOR', TRUE);
+        OPEN :ddl_cursor FOR %s;
+    END;
+""" % _DDL_QUERY.strip()
+
+
+# DROP TABLE sem consulta pr├®via ao dicion├írio; :dropped = 0 se a tabela n├úo existia
+_DROP_TABLE_BLOCK = """
+    BEGIN
+        EXECUTE IMMEDIATE 'DROP TABLE ' || :owner || '.' || :table_name || ' CASCADE CONSTRAINTS';
+        :dropped := 1;
+    EXCEPTION
+        WHEN OTHERS THEN
+            IF SQLCODE != -942 THEN
+                RAISE;
+            END IF;
+            :dropped := 0;
+    END;
+"""
+
+
+# Casa se o texto tem ao menos 10 caracteres entre o primeiro e o ├║ltimo n├úo-branco
+_DDL_MIN_CONTENT = re.compile(r"\s*\S.{8}.*?\S", re.S)
+
+
+def _looks_truncated(ddl: str) -> bool:
+    """
+    Equivale a len(ddl.strip()) < 10 (DDL vazio ou curto demais), sem copiar o
+    texto inteiro: o regex para assim que encontra conte├║do suficiente.
+    """
+    return not ddl or _DDL_MIN_CONTENT.match(ddl) is None
+
+
+def _clob_as_string(cursor: cx_Oracle.Cursor, name, default_type, size, precision, scale):
+    """outputtypehandler: traz colunas CLOB como str junto com a linha, sem ler o LOB em partes."""
+    if default_type == cx_Oracle.CLOB:
+        return cursor.var(cx_Oracle.LONG_STRING, arraysize=cursor.arraysize)
+
+
+def _estimate_row_bytes(description) -> int:
+    """
+    Largura estimada de uma linha em bytes a partir do description: strings
+    contam 40% do tamanho declarado (preenchimento m├®dio), LOBs um valor fixo.
+    """
+    total = 0
+    for _, db_type, _, internal_size, _, _, _ in description:
+        if db_type in (cx_Oracle.CLOB, cx_Oracle.BLOB, cx_Oracle.NCLOB, cx_Oracle.LONG_STRING, cx_Oracle.LONG_BINARY):
+            total += LOB_ESTIMATED_BYTES
+        elif db_type in (cx_Oracle.STRING, cx_Oracle.FIXED_CHAR):
+            total += max(1, (internal_size or 0) * 2 // 5)
+        else:
+            total += internal_size or 22
+    return max(1, total)
+
+
+def _input_sizes(description) -> list:
+    """
+    Tipos de bind para o INSERT no destino a partir do description da consulta na
+    origem (mesmas colunas, na mesma ordem). Strings usam o tamanho da coluna;
+    tipos sem correspond├¬ncia ficam None e s├úo deduzidos pelo cx_Oracle.
+    """
+    sizes = []
+    for _, db_type, _, internal_size, _, _, _ in description:
+        if db_type in (cx_Oracle.STRING, cx_Oracle.FIXED_CHAR):
+            sizes.append(internal_size or None)
+        elif db_type in (cx_Oracle.NUMBER, cx_Oracle.DATETIME, cx_Oracle.TIMESTAMP):
+            sizes.append(db_type)
+        elif db_type in (cx_Oracle.CLOB, cx_Oracle.NCLOB):
+            # LOBs chegam como str/bytes (ver _lob_as_value) e seguem inline no
+            # INSERT, sem criar um locator tempor├írio por valor
+            sizes.append(cx_Oracle.LONG_STRING)
+        elif db_type == cx_Oracle.BLOB:
+            sizes.append(cx_Oracle.LONG_BINARY)
+        else:
+            sizes.append(None)
+    return sizes
+
+
+def _lob_as_value(cursor: cx_Oracle.Cursor, name, default_type, size, precision, scale):
+    """outputtypehandler dos dados: CLOB/NCLOB como str e BLOB como bytes, lidos junto com a linha."""
+    if default_type in (cx_Oracle.CLOB, cx_Oracle.NCLOB):
+        return cursor.var(cx_Oracle.LONG_STRING, arraysize=cursor.arraysize)
+    if default_type == cx_Oracle.BLOB:
+        return cursor.var(cx_Oracle.LONG_BINARY, arraysize=cursor.arraysize)
+
+
+def _catalog_cursor(connection: cx_Oracle.Connection) -> cx_Oracle.Cursor:
+    """Cursor para as consultas de cat├ílogo, lidas em lotes de CATALOG_FETCH_ARRAYSIZE."""
+    cursor = connection.cursor()
+    cursor.arraysize = CATALOG_FETCH_ARRAYSIZE
+    # prefetchrows s├│ existe no cx_Oracle 8.0+
+    if hasattr(cursor, "prefetchrows"):
+        cursor.prefetchrows = CATALOG_FETCH_ARRAYSIZE + 1
+    return cursor
+
+
+def _ddl_cursor(connection: cx_Oracle.Connection) -> cx_Oracle.Cursor:
+    """Cursor para as consultas de DDL: lotes de DDL_FETCH_ARRAYSIZE e CLOB como str."""
+    cursor = connection.cursor()
+    cursor.arraysize = DDL_FETCH_ARRAYSIZE
+    # prefetchrows s├│ existe no cx_Oracle 8.0+
+    if hasattr(cursor, "prefetchrows"):
+        cursor.prefetchrows = DDL_FETCH_ARRAYSIZE + 1
+    cursor.outputtypehandler = _clob_as_string
+    return cursor
+
+
+class AdaptiveBatchSize:
+    """
+    Tamanho de lote ajustado durante a carga de uma tabela (AIMD): dobra enquanto
+    a vaz├úo do executemany (linhas/s) melhora ao menos 5% e cai pela metade quando
+    piora 10% ou mais. S├│ lotes do tamanho atual contam como medida (os que j├í
+    estavam na fila antes do ajuste e o ├║ltimo, parcial, s├úo ignorados).
+    """
+
+    def __init__(self, initial: int, minimum: int = ADAPTIVE_MIN_BATCH_SIZE, maximum: int = MAX_BATCH_SIZE):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.current = max(minimum, min(maximum, initial))
+        self.last_rows_per_sec = 0.0
+
+    def next(self, observed_rows: int, elapsed_s: float) -> int:
+        if observed_rows != self.current or elapsed_s <= 0:
+            return self.current
+        rows_per_sec = observed_rows / elapsed_s
+        if rows_per_sec >= self.last_rows_per_sec * 1.05:
+            self.current = min(self.maximum, self.current * 2)
+        elif rows_per_sec <= self.last_rows_per_sec * 0.9:
+            self.current = max(self.minimum, self.current // 2)
+        self.last_rows_per_sec = rows_per_sec
+        return self.current
+
 
 class OracleExporter:
-    def __init__(self, source: OracleConfig, target: OracleConfig, batch_size: int = 500):
+    def __init__(
+        self,
+        source: OracleConfig,
+        target: OracleConfig,
+        batch_size: int | None = None,
+        parallel_tables: int = 4,
+        adaptive_batch: bool = False,
+        commit_size: int = 0,
+    ):
         self.source = source
         self.target = target
-        self.batch_size = batch_size
+        # Sem batch_size, o lote de cada tabela ├® dimensionado pela largura da
+        # linha (ver _batch_size_for); um batch_size informado ├® usado como est├í
+        self.size_by_row_width = batch_size is None
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        # Com adaptive_batch, batch_size ├® s├│ o ponto de partida: cada tabela
+        # ajusta o lote pela vaz├úo medida (ver AdaptiveBatchSize)
+        self.adaptive_batch = adaptive_batch
+        # Linhas inseridas entre commits intermedi├írios dentro de uma tabela
+        # (0 = um ├║nico commit ao fim de cada tabela)
+        self.commit_size = max(0, commit_size)
+        # Tabelas copiadas ao mesmo tempo na etapa de dados, cada uma com suas
+        # pr├│prias sess├Áes dos pools de origem e destino (1 = sequencial)
+        self.parallel_tables = max(1, parallel_tables)
+        # Tabelas existentes no destino por owner, carregadas no in├¡cio do DDL de
+        # cada schema e mantidas em dia a cada CREATE/DROP (ver _table_exists)
+        self._target_tables: dict[str, set[str]] = {}
 
     def copy(self, schemas: Iterable[str]) -> None:
-        schema_list = list(schemas) or [self.source.schema or self.source.user.upper()]
+        # Owners normalizados uma ├║nica vez; os m├®todos internos recebem o schema
+        # j├í em mai├║sculas e o usam direto nos binds :owner
+        schema_list = [schema.upper() for schema in schemas] or [(self.source.schema or self.source.user).upper()]
         total_schemas = len(schema_list)
         logger.info("=" * 70)
         logger.info("INICIANDO PROCESSO DE EXPORTA├ç├âO")
@@ -31,7 +241,12 @@ class OracleExporter:
         logger.info("Schemas a processar: %s", ", ".join(schema_list))
         logger.info("Banco de origem: %s", self.source.dsn)
         logger.info("Banco de destino: %s", self.target.dsn)
-        logger.info("Tamanho do lote: %d linhas", self.batch_size)
+        if self.adaptive_batch:
+            logger.info("Tamanho do lote: autom├ítico (a partir de %d linhas)", self.batch_size)
+        elif self.size_by_row_width:
+            logger.info("Tamanho do lote: pela largura da linha de cada tabela (m├¡nimo %d linhas)", self.batch_size)
+        else:
+            logger.info("Tamanho do lote: %d linhas", self.batch_size)
         logger.info("")
         
         for idx, schema in enumerate(schema_list, 1):
@@ -105,88 +320,46 @@ class OracleExporter:
     def _copy_ddl(self, source_conn: cx_Oracle.Connection, target_conn: cx_Oracle.Connection, schema: str) -> None:
         logger.info(">>> Etapa 1/2: Copiando objetos DDL (metadados)")
         logger.info("Configurando DBMS_METADATA...")
-        cursor = source_conn.cursor()
+        cursor = _ddl_cursor(source_conn)
+        ddl_cursor = _ddl_cursor(source_conn)
         
-        # Usar execute ao inv├®s de callproc para melhor compatibilidade com cx_Oracle 6.x
+        # Transforma├º├Áes do DBMS_METADATA e abertura da consulta de DDL (REF CURSOR)
+        # em um ├║nico bloco; usar execute ao inv├®s de callproc para melhor
+        # compatibilidade com cx_Oracle 6.x
         try:
-            cursor.execute("""
-                BEGIN
-                    DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'STORAGE', FALSE);
-                    DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SEGMENT_ATTRIBUTES', FALSE);
-                    DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SQLTERMINATOR', TRUE);
-                END;
-            """)
+            cursor.execute(_DDL_BLOCK, ddl_cursor=ddl_cursor, owner=schema)
             logger.info("Ô£ô Configura├º├úo do DBMS_METADATA conclu├¡da")
         except cx_Oracle.DatabaseError as e:
             error, = e.args
             # Se DBMS_METADATA n├úo estiver dispon├¡vel, continuar sem as transforma├º├Áes
             if error.code in (4043, 6550):  # Package n├úo existe ou n├úo acess├¡vel
                 logger.warning("DBMS_METADATA n├úo dispon├¡vel, continuando sem transforma├º├Áes")
+                ddl_cursor = None
             else:
                 raise
 
+        self._load_target_tables(target_conn, schema)
+        objects_by_type = self._fetch_ddl_objects(cursor, ddl_cursor, schema)
+        
         total_objects = 0
         for object_type in DDL_OBJECTS:
             logger.info("  Processando objetos do tipo: %s", object_type)
-            
-            # Para Oracle 9i, "PACKAGE BODY" deve ser consultado como "PACKAGE BODY" mas usado como "PACKAGE_BODY" no GET_DDL
-            query_object_type = object_type
-            if object_type == "PACKAGE_BODY":
-                # No all_objects, o tipo ├® "PACKAGE BODY" (com espa├ºo)
-                query_object_type = "PACKAGE BODY"
-            
-            try:
-                cursor.execute(
-                    """
-                    SELECT object_name, dbms_metadata.get_ddl(object_type => :obj_type, name => object_name, schema => owner) ddl
-                    FROM all_objects
-                    WHERE owner = :owner
-                      AND object_type = :query_type
-                      AND generated = 'N'
-                    ORDER BY object_name
-                    """,
-                    obj_type=object_type.replace("_", " "),  # Converter PACKAGE_BODY para "PACKAGE BODY" para GET_DDL
-                    query_type=query_object_type,  # Usar "PACKAGE BODY" para consulta em all_objects
-                    owner=schema.upper(),
-                )
-                objects = list(cursor)
-            except cx_Oracle.DatabaseError as e:
-                error, = e.args
-                if error.code == 31600:  # ORA-31600: invalid input value for parameter OBJECT_TYPE
-                    logger.warning("    Tipo de objeto '%s' n├úo suportado pelo DBMS_METADATA neste banco, pulando...", object_type)
-                    objects = []
-                else:
-                    raise
+            objects = objects_by_type.get(object_type, [])
             if objects:
                 logger.info("    Encontrados %d objeto(s) do tipo %s", len(objects), object_type)
+                applied = set()
+                if object_type in BATCHED_DDL_OBJECTS:
+                    applied = self._apply_ddl_batch(target_conn, schema, objects)
+                    total_objects += len(applied)
                 for name, ddl in objects:
+                    if name in applied:
+                        continue
                     try:
-                        # Converter DDL para string e limpar
-                        # Para objetos grandes (PACKAGE, PACKAGE_BODY), ler completamente
-                        if hasattr(ddl, "read"):
-                            # Se for um LOB, ler todo o conte├║do
-                            try:
-                                if hasattr(ddl, "size"):
-                                    # LOB tem m├®todo size(), ler tudo de uma vez
-                                    ddl_str = ddl.read(ddl.size())
-                                else:
-                                    # Tentar ler em chunks
-                                    chunks = []
-                                    while True:
-                                        chunk = ddl.read(8192)  # Ler 8KB por vez
-                                        if not chunk:
-                                            break
-                                        chunks.append(chunk)
-                                    ddl_str = "".join(chunks)
-                            except Exception as e_read:
-                                logger.warning("    ÔÜá Erro ao ler LOB completo, tentando m├®todo alternativo: %s", e_read)
-                                # Fallback: tentar ler como string
-                                ddl_str = str(ddl)
-                        else:
-                            ddl_str = str(ddl)
+                        # O CLOB do GET_DDL j├í chega como str (ver _clob_as_string)
+                        ddl_str = ddl or ""
                         
                         # Verificar se o DDL est├í vazio ou muito curto (pode indicar truncamento)
-                        if not ddl_str or len(ddl_str.strip()) < 10:
+                        if _looks_truncated(ddl_str):
                             logger.warning("    ÔÜá %s.%s: DDL muito curto ou vazio, pode estar truncado", schema, name)
                             if object_type in ("PACKAGE", "PACKAGE_BODY"):
                                 logger.warning("    Tentando obter DDL completo usando m├®todo alternativo...")
@@ -208,6 +381,8 @@ class OracleExporter:
                             logger.debug("    DDL preview: %s...", ddl_preview)
                         
                         execute_non_query(target_conn, ddl_str)
+                        if object_type == "TABLE":
+                            self._set_table_exists(schema, name, True)
                         logger.info("    Ô£ô %s.%s criado/aplicado", schema, name)
                         total_objects += 1
                     except cx_Oracle.DatabaseError as exc:
@@ -220,6 +395,7 @@ class OracleExporter:
                                     # Tentar criar novamente ap├│s remover
                                     try:
                                         execute_non_query(target_conn, ddl_str)
+                                        self._set_table_exists(schema, name, True)
                                         logger.info("    Ô£ô %s.%s recriado com sucesso", schema, name)
                                         total_objects += 1
                                     except Exception as e3:
@@ -246,13 +422,14 @@ class OracleExporter:
                             
                             # Tentar executar statement por statement ap├│s limpeza
                             try:
-                                from .db_utils import clean_ddl
                                 statements = clean_ddl(ddl_str)
                                 with target_conn.cursor() as cur:
                                     for stmt in statements:
                                         if stmt.strip():
                                             cur.execute(stmt)
                                 target_conn.commit()
+                                if object_type == "TABLE":
+                                    self._set_table_exists(schema, name, True)
                                 logger.info("    Ô£ô %s.%s criado/aplicado (ap├│s limpeza)", schema, name)
                                 total_objects += 1
                             except Exception as e2:
@@ -268,6 +445,102 @@ class OracleExporter:
         
         logger.info("Ô£ô Etapa 1/2 conclu├¡da: %d objeto(s) DDL processado(s)", total_objects)
 
+    @staticmethod
+    def _apply_ddl_batch(target_conn: cx_Oracle.Connection, schema: str, objects: list[tuple[str, str]]) -> set[str]:
+        """
+        Aplica no destino, em blocos an├┤nimos, os objetos cujo DDL ├® um ├║nico
+        statement. Cada EXECUTE IMMEDIATE tem seu pr├│prio tratador de exce├º├úo e
+        devolve o SQLCODE, ent├úo a falha de um objeto n├úo afeta os demais.
+        Retorna os nomes aplicados; os demais (com falha, v├írios statements ou
+        DDL suspeito de truncamento) ficam para o processamento objeto a objeto.
+        """
+        candidates = []
+        for name, ddl in objects:
+            if _looks_truncated(ddl or ""):
+                continue
+            statements = clean_ddl(ddl)
+            if len(statements) == 1 and len(statements[0]) <= _MAX_BATCHED_DDL_LENGTH:
+                candidates.append((name, statements[0]))
+        
+        applied: set[str] = set()
+        with target_conn.cursor() as cursor:
+            for start in range(0, len(candidates), DDL_BATCH_SIZE):
+                batch = candidates[start:start + DDL_BATCH_SIZE]
+                block = "BEGIN\n" + "".join(
+                    f"  BEGIN EXECUTE IMMEDIATE :s{i}; :c{i} := 0; "
+                    f"EXCEPTION WHEN OTHERS THEN :c{i} := SQLCODE; END;\n"
+                    for i in range(len(batch))
+                ) + "END;"
+                binds = {}
+                for i, (_, stmt) in enumerate(batch):
+                    binds[f"s{i}"] = stmt
+                    binds[f"c{i}"] = cursor.var(int)
+                try:
+                    cursor.execute(block, binds)
+                except cx_Oracle.DatabaseError as exc:
+                    error, = exc.args
+                    logger.warning("    ÔÜá Falha ao aplicar lote de DDL (c├│digo %s), aplicando objeto a objeto...", error.code)
+                    continue
+                for i, (name, _) in enumerate(batch):
+                    if binds[f"c{i}"].getvalue() == 0:
+                        applied.add(name)
+                        logger.info("    Ô£ô %s.%s criado/aplicado", schema, name)
+        return applied
+
+    @staticmethod
+    def _fetch_ddl_objects(
+        cursor: cx_Oracle.Cursor,
+        ddl_cursor: cx_Oracle.Cursor | None,
+        schema: str,
+    ) -> dict[str, list[tuple[str, str]]]:
+        """
+        Busca (nome, DDL) dos objetos do schema, agrupados por tipo de DDL_OBJECTS,
+        com uma ├║nica consulta ao all_objects: a do REF CURSOR j├í aberto por
+        _DDL_BLOCK (ddl_cursor) ou, sem ele, _DDL_QUERY executada em cursor.
+        Se algum tipo n├úo for suportado pelo DBMS_METADATA do banco (ORA-31600),
+        consulta tipo a tipo e pula os que falharem.
+        """
+        objects_by_type: dict[str, list[tuple[str, str]]] = {}
+        try:
+            if ddl_cursor is None:
+                cursor.execute(_DDL_QUERY, owner=schema)
+                ddl_cursor = cursor
+            # A consulta vem ordenada por object_type: um grupo cont├¡guo por tipo
+            for object_type, rows in groupby(ddl_cursor.fetchall(), key=itemgetter(0)):
+                objects_by_type[object_type.replace(" ", "_")] = [(name, ddl) for _, name, ddl in rows]
+            return objects_by_type
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            if error.code != 31600:  # ORA-31600: invalid input value for parameter OBJECT_TYPE
+                raise
+        
+        objects_by_type.clear()
+        for object_type in DDL_OBJECTS:
+            # No all_objects, o tipo ├® "PACKAGE BODY" (com espa├ºo)
+            query_object_type = object_type.replace("_", " ")
+            try:
+                cursor.execute(
+                    """
+                    SELECT object_name, dbms_metadata.get_ddl(object_type => :obj_type, name => object_name, schema => owner) ddl
+                    FROM all_objects
+                    WHERE owner = :owner
+                      AND object_type = :query_type
+                      AND generated = 'N'
+                    ORDER BY object_name
+                    """,
+                    obj_type=query_object_type,
+                    query_type=query_object_type,
+                    owner=schema,
+                )
+                objects_by_type[object_type] = cursor.fetchall()
+            except cx_Oracle.DatabaseError as e:
+                error, = e.args
+                if error.code == 31600:
+                    logger.warning("    Tipo de objeto '%s' n├úo suportado pelo DBMS_METADATA neste banco, pulando...", object_type)
+                else:
+                    raise
+        return objects_by_type
+
     def _copy_data(self, source_conn: cx_Oracle.Connection, target_conn: cx_Oracle.Connection, schema: str) -> None:
         logger.info(">>> Etapa 2/2: Copiando dados das tabelas")
         tables = self._list_tables(source_conn, schema)
@@ -279,33 +552,31 @@ class OracleExporter:
             logger.info("Nenhuma tabela encontrada para copiar")
             return
         
-        total_rows_copied = 0
-        tables_missing = []
-        for idx, table in enumerate(tables, 1):
-            logger.info("  [%d/%d] Processando tabela: %s.%s", idx, total_tables, schema, table)
-            
-            # Verificar se a tabela existe no destino antes de tentar copiar dados
-            if not self._table_exists(target_conn, schema, table):
-                logger.error("    Ô£ù Tabela %s.%s N├âO EXISTE no destino!", schema, table)
-                logger.error("    A tabela precisa ser criada na etapa de DDL antes de copiar dados.")
-                tables_missing.append(f"{schema}.{table}")
-                continue
-            
-            try:
-                self._truncate_target_table(target_conn, schema, table)
-                rows, columns = self._fetch_rows(source_conn, schema, table)
-                row_count = len(rows)
-                if row_count > 0:
-                    logger.info("    Lendo %d linha(s) da origem...", row_count)
-                    self._insert_rows(target_conn, schema, table, columns, rows)
-                    logger.info("    Ô£ô %d linha(s) copiada(s) com sucesso", row_count)
-                    total_rows_copied += row_count
-                else:
-                    logger.info("    Ô£ô Tabela vazia (0 linhas)")
-            except Exception as e:
-                logger.error("    Ô£ù Erro ao processar tabela %s.%s: %s", schema, table, e)
-                # Continuar com pr├│xima tabela ao inv├®s de parar tudo
-                logger.warning("    Continuando com pr├│xima tabela...")
+        positions = [f"{idx}/{total_tables}" for idx in range(1, total_tables + 1)]
+        workers = min(self.parallel_tables, total_tables)
+        # FKs ficam desabilitadas durante a carga: as tabelas s├úo truncadas e
+        # carregadas em qualquer ordem (e em paralelo), pais e filhas
+        foreign_keys: list[tuple[str, str]] = []
+        try:
+            self._disable_foreign_keys(target_conn, schema, foreign_keys)
+            if workers > 1:
+                logger.info("Copiando at├® %d tabelas em paralelo", workers)
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exporter-table") as executor:
+                    results = list(executor.map(
+                        lambda table, position: self._copy_table_pooled(schema, table, position),
+                        tables,
+                        positions,
+                    ))
+            else:
+                results = [
+                    self._copy_table(source_conn, target_conn, schema, table, position)
+                    for table, position in zip(tables, positions)
+                ]
+        finally:
+            self._enable_foreign_keys(target_conn, foreign_keys)
+        
+        total_rows_copied = sum(count for count in results if count)
+        tables_missing = [f"{schema}.{table}" for table, count in zip(tables, results) if count is None]
         
         if tables_missing:
             logger.error("")
@@ -322,9 +593,61 @@ class OracleExporter:
         logger.info("Ô£ô Etapa 2/2 conclu├¡da: %d tabela(s) processada(s), %d linha(s) copiada(s) no total", 
                    total_tables, total_rows_copied)
 
+    def _copy_table_pooled(self, schema: str, table: str, position: str) -> int | None:
+        """_copy_table em uma thread de trabalho, com sess├Áes pr├│prias de origem e destino."""
+        try:
+            with oracle_connection(self.source) as source_conn, oracle_connection(self.target) as target_conn:
+                return self._copy_table(source_conn, target_conn, schema, table, position)
+        except Exception as e:
+            logger.error("    Ô£ù Erro ao processar tabela %s.%s: %s", schema, table, e)
+            return 0
+
+    def _copy_table(
+        self,
+        source_conn: cx_Oracle.Connection,
+        target_conn: cx_Oracle.Connection,
+        schema: str,
+        table: str,
+        position: str,
+    ) -> int | None:
+        """
+        Copia os dados de uma tabela. Retorna o n├║mero de linhas copiadas, ou None
+        se a tabela n├úo existe no destino.
+        """
+        logger.info("  [%s] Processando tabela: %s.%s", position, schema, table)
+        
+        # Verificar se a tabela existe no destino antes de tentar copiar dados
+        if not self._table_exists(target_conn, schema, table):
+            logger.error("    Ô£ù Tabela %s.%s N├âO EXISTE no destino!", schema, table)
+            logger.error("    A tabela precisa ser criada na etapa de DDL antes de copiar dados.")
+            return None
+        
+        try:
+            self._truncate_target_table(target_conn, schema, table)
+            # O TRUNCATE torna os ├¡ndices utiliz├íveis de novo, por isso s├│ depois dele
+            indexes = self._disable_indexes(target_conn, schema, table)
+            try:
+                row_count = None
+                if self.source.db_link:
+                    row_count = self._copy_table_via_link(source_conn, target_conn, schema, table, self.source.db_link)
+                if row_count is None:
+                    row_count = self._copy_table_rows(source_conn, target_conn, schema, table)
+            finally:
+                self._rebuild_indexes(target_conn, indexes)
+            if row_count > 0:
+                logger.info("    Ô£ô %s.%s: %d linha(s) copiada(s) com sucesso", schema, table, row_count)
+            else:
+                logger.info("    Ô£ô %s.%s: tabela vazia (0 linhas)", schema, table)
+            return row_count
+        except Exception as e:
+            logger.error("    Ô£ù Erro ao processar tabela %s.%s: %s", schema, table, e)
+            # Continuar com pr├│xima tabela ao inv├®s de parar tudo
+            logger.warning("    Continuando com pr├│xima tabela...")
+            return 0
+
     @staticmethod
     def _list_tables(connection: cx_Oracle.Connection, schema: str) -> list[str]:
-        cursor = connection.cursor()
+        cursor = _catalog_cursor(connection)
         cursor.execute(
             """
             SELECT table_name
@@ -333,28 +656,268 @@ class OracleExporter:
               AND temporary = 'N'
             ORDER BY table_name
             """,
-            owner=schema.upper(),
+            owner=schema,
         )
         return [name for (name,) in cursor]
 
     @staticmethod
-    def _fetch_rows(connection: cx_Oracle.Connection, schema: str, table: str):
+    def _list_columns(connection: cx_Oracle.Connection, schema: str, table: str) -> list[str]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT column_name
+                FROM all_tab_columns
+                WHERE owner = :owner
+                  AND table_name = :table
+                ORDER BY column_id
+                """,
+                owner=schema,
+                table=table,
+            )
+            return [name for (name,) in cursor]
+
+    @staticmethod
+    def _fetch_rows(connection: cx_Oracle.Connection, schema: str, table: str, batch_size: int = 500):
+        columns = OracleExporter._list_columns(connection, schema, table)
         cursor = connection.cursor()
-        cursor.execute(
-            """
-            SELECT column_name
-            FROM all_tab_columns
-            WHERE owner = :owner
-              AND table_name = :table
-            ORDER BY column_id
-            """,
-            owner=schema.upper(),
-            table=table,
-        )
-        columns = [name for (name,) in cursor]
         query = f'SELECT {", ".join(columns)} FROM {schema}.{table}'
+        # Buscar muitas linhas por round-trip (o padr├úo do cx_Oracle ├® 100)
+        cursor.arraysize = max(DATA_FETCH_ARRAYSIZE, batch_size * 4)
+        if hasattr(cursor, "prefetchrows"):
+            cursor.prefetchrows = cursor.arraysize + 1
+        cursor.outputtypehandler = _lob_as_value
         cursor.execute(query)
-        return cursor.fetchall(), columns
+        return cursor, columns
+
+    @staticmethod
+    def _disable_foreign_keys(connection: cx_Oracle.Connection, schema: str, disabled: list[tuple[str, str]]) -> None:
+        """
+        Desabilita as FKs habilitadas do schema no destino, acrescentando
+        (schema.tabela, constraint) em disabled a cada uma desabilitada: se falhar
+        no meio, o chamador ainda reabilita as que j├í foram desabilitadas.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT table_name, constraint_name
+                FROM all_constraints
+                WHERE owner = :owner
+                  AND constraint_type = 'R'
+                  AND status = 'ENABLED'
+                """,
+                owner=schema,
+            )
+            for table, constraint in cursor.fetchall():
+                cursor.execute(f'ALTER TABLE {schema}.{table} DISABLE CONSTRAINT {constraint}')
+                disabled.append((f"{schema}.{table}", constraint))
+        if disabled:
+            logger.info("%d foreign key(s) desabilitada(s) durante a carga", len(disabled))
+
+    @staticmethod
+    def _enable_foreign_keys(connection: cx_Oracle.Connection, foreign_keys: list[tuple[str, str]]) -> None:
+        if not foreign_keys:
+            return
+        enabled = 0
+        with connection.cursor() as cursor:
+            for table_name, constraint in foreign_keys:
+                try:
+                    cursor.execute(f'ALTER TABLE {table_name} ENABLE CONSTRAINT {constraint}')
+                    enabled += 1
+                except cx_Oracle.DatabaseError as exc:
+                    error, = exc.args
+                    logger.warning("    ÔÜá N├úo foi poss├¡vel reabilitar %s em %s: %s (c├│digo %s)",
+                                   constraint, table_name, error.message, error.code)
+        logger.info("%d/%d foreign key(s) reabilitada(s)", enabled, len(foreign_keys))
+
+    @staticmethod
+    def _disable_indexes(connection: cx_Oracle.Connection, schema: str, table: str) -> list[str]:
+        """
+        Marca como UNUSABLE os ├¡ndices n├úo ├║nicos da tabela no destino, para que a
+        carga n├úo os mantenha linha a linha (├¡ndices ├║nicos/PK continuam ativos).
+        Retorna os ├¡ndices a reconstruir com _rebuild_indexes.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT owner, index_name
+                FROM all_indexes
+                WHERE table_owner = :owner
+                  AND table_name = :table_name
+                  AND uniqueness = 'NONUNIQUE'
+                  AND index_type IN ('NORMAL', 'BITMAP')
+                  AND status = 'VALID'
+                """,
+                owner=schema,
+                table_name=table.upper(),
+            )
+            indexes = [f"{owner}.{name}" for owner, name in cursor]
+            if not indexes:
+                return indexes
+            cursor.execute("ALTER SESSION SET skip_unusable_indexes = TRUE")
+            disabled = []
+            try:
+                for index in indexes:
+                    cursor.execute(f"ALTER INDEX {index} UNUSABLE")
+                    disabled.append(index)
+            except BaseException:
+                # Falha no meio: reconstr├│i os j├í marcados e desfaz o ALTER SESSION antes de propagar
+                if disabled:
+                    OracleExporter._rebuild_indexes(connection, disabled)
+                else:
+                    cursor.execute("ALTER SESSION SET skip_unusable_indexes = FALSE")
+                raise
+        return indexes
+
+    @staticmethod
+    def _rebuild_indexes(connection: cx_Oracle.Connection, indexes: list[str]) -> None:
+        if not indexes:
+            return
+        with connection.cursor() as cursor:
+            try:
+                for index in indexes:
+                    try:
+                        cursor.execute(f"ALTER INDEX {index} REBUILD")
+                    except cx_Oracle.DatabaseError as exc:
+                        error, = exc.args
+                        logger.warning("    ÔÜá Erro ao reconstruir ├¡ndice %s: %s (c├│digo %s)", index, error.message, error.code)
+            finally:
+                # A sess├úo volta ao pool: desfaz o ALTER SESSION de _disable_indexes
+                cursor.execute("ALTER SESSION SET skip_unusable_indexes = FALSE")
+        logger.info("    %d ├¡ndice(s) reconstru├¡do(s)", len(indexes))
+
+    @staticmethod
+    def _copy_table_via_link(
+        source_conn: cx_Oracle.Connection,
+        target_conn: cx_Oracle.Connection,
+        schema: str,
+        table: str,
+        db_link: str,
+    ) -> int | None:
+        """
+        Copia os dados inteiramente no servidor com INSERT /*+ APPEND */ ... SELECT
+        pelo database link (criado no destino, apontando para a origem), sem trazer
+        as linhas ao cliente. Retorna o n├║mero de linhas copiadas, ou None se o
+        INSERT falhar (o chamador usa ent├úo a c├│pia pelo cliente).
+        """
+        column_list = ", ".join(OracleExporter._list_columns(source_conn, schema, table))
+        sql = (
+            f"INSERT /*+ APPEND */ INTO {schema}.{table} ({column_list}) "
+            f"SELECT {column_list} FROM {schema}.{table}@{db_link}"
+        )
+        try:
+            with target_conn.cursor() as cursor:
+                cursor.execute(sql)
+                row_count = cursor.rowcount
+            target_conn.commit()
+            logger.info("    Dados copiados via database link %s", db_link)
+            return row_count
+        except cx_Oracle.DatabaseError as exc:
+            error, = exc.args
+            target_conn.rollback()
+            logger.warning("    ÔÜá Falha ao copiar via database link %s: %s (c├│digo %s); copiando pelo cliente...",
+                           db_link, error.message, error.code)
+            return None
+
+    def _copy_table_rows(
+        self,
+        source_conn: cx_Oracle.Connection,
+        target_conn: cx_Oracle.Connection,
+        schema: str,
+        table: str,
+    ) -> int:
+        """
+        Copia as linhas de schema.table da origem para o destino, lendo e inserindo
+        ao mesmo tempo (ver _stream_rows). Retorna o total de linhas copiadas.
+        """
+        source_cursor, columns = self._fetch_rows(source_conn, schema, table, self.batch_size)
+        description = source_cursor.description
+        input_sizes = _input_sizes(description)
+        sizer = None
+        if self.adaptive_batch:
+            # Come├ºa em batch_size e tem espa├ºo para dobrar at├® o que cabe em
+            # BATCH_TARGET_BYTES pela largura da linha
+            sizer = AdaptiveBatchSize(self.batch_size, maximum=self._row_width_batch_size(description))
+            batch_size = sizer.current
+        else:
+            batch_size = self._batch_size_for(description)
+            if batch_size != self.batch_size:
+                logger.info("    Lote ajustado para %d linhas (~%d bytes por linha)", batch_size, _estimate_row_bytes(description))
+        source_cursor.arraysize = max(source_cursor.arraysize, sizer.maximum if sizer else batch_size)
+        batches = self._stream_rows(source_cursor, batch_size, sizer)
+        try:
+            total_rows = self._insert_rows(target_conn, schema, table, columns, batches, input_sizes, batch_size, sizer)
+        finally:
+            batches.close()
+            source_cursor.close()
+        if sizer is not None:
+            logger.info("    Lote autom├ítico de %s.%s terminou em %d linhas (use --batch-size %d para fix├í-lo)",
+                        schema, table, sizer.current, sizer.current)
+        return total_rows
+
+    def _batch_size_for(self, description) -> int:
+        """
+        Linhas por lote para a tabela: batch_size, se foi informado; sen├úo o quanto
+        cabe em BATCH_TARGET_BYTES pela largura estimada da linha, entre batch_size
+        (m├¡nimo) e MAX_BATCH_SIZE.
+        """
+        if not self.size_by_row_width:
+            return self.batch_size
+        return self._row_width_batch_size(description)
+
+    def _row_width_batch_size(self, description) -> int:
+        """Linhas que cabem em BATCH_TARGET_BYTES, entre batch_size e MAX_BATCH_SIZE."""
+        row_bytes = _estimate_row_bytes(description)
+        return max(self.batch_size, min(MAX_BATCH_SIZE, BATCH_TARGET_BYTES // row_bytes))
+
+    def _stream_rows(
+        self,
+        cursor: cx_Oracle.Cursor,
+        batch_size: int,
+        sizer: AdaptiveBatchSize | None = None,
+    ) -> Iterator[list[tuple]]:
+        """
+        Entrega as linhas do cursor em lotes de batch_size (ou do tamanho atual de
+        sizer, quando o lote ├® autom├ítico), buscados por uma thread
+        enquanto o chamador insere os lotes anteriores no destino. A fila limitada
+        (PIPELINE_DEPTH lotes) segura a leitura quando a inser├º├úo fica para tr├ís.
+        """
+        batches: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+        stop = threading.Event()
+        
+        def put(item) -> None:
+            # Desiste de enfileirar se o consumidor j├í parou (ex: erro na inser├º├úo)
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+        
+        def produce() -> None:
+            try:
+                while not stop.is_set():
+                    rows = cursor.fetchmany(batch_size if sizer is None else sizer.current)
+                    if not rows:
+                        break
+                    put(rows)
+            except BaseException as exc:
+                put(exc)
+            finally:
+                put(_END_OF_ROWS)
+        
+        producer = threading.Thread(target=produce, name="exporter-fetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is _END_OF_ROWS:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
 
     def _insert_rows(
         self,
@@ -362,27 +925,69 @@ class OracleExporter:
         schema: str,
         table: str,
         columns: list[str],
-        rows: list[tuple],
-    ) -> None:
-        if not rows:
-            return
-
+        batches: Iterable[list[tuple]],
+        input_sizes: list | None = None,
+        batch_size: int | None = None,
+        sizer: AdaptiveBatchSize | None = None,
+    ) -> int:
+        batch_size = batch_size or self.batch_size
+        # Montado uma vez por tabela: o mesmo texto em todos os lotes reaproveita o parse
         placeholders = ", ".join([f":{idx+1}" for idx in range(len(columns))])
         insert_sql = f'INSERT INTO {schema}.{table} ({", ".join(columns)}) VALUES ({placeholders})'
 
-        total_batches = (len(rows) + self.batch_size - 1) // self.batch_size
+        total_rows = 0
+        uncommitted_rows = 0
+        batch_idx = 0
         with connection.cursor() as cursor:
-            for batch_idx, batch in enumerate(chunked(rows, self.batch_size), 1):
-                cursor.executemany(insert_sql, batch)
-                if total_batches > 1:
-                    logger.info("      Inserindo lote %d/%d (%d linhas)...", batch_idx, total_batches, len(batch))
-            connection.commit()
-            if total_batches > 1:
-                logger.info("      Ô£ô Commit realizado")
+            # Pr├®-aloca os buffers de bind para o lote inteiro
+            cursor.bindarraysize = batch_size
+            for batch_idx, batch in enumerate(batches, 1):
+                if input_sizes:
+                    # Tipos declarados evitam que o cx_Oracle os deduza dos valores de cada lote
+                    cursor.setinputsizes(*input_sizes)
+                if sizer is None:
+                    cursor.executemany(insert_sql, batch)
+                else:
+                    started = time.perf_counter()
+                    cursor.executemany(insert_sql, batch)
+                    sizer.next(len(batch), time.perf_counter() - started)
+                total_rows += len(batch)
+                uncommitted_rows += len(batch)
+                if batch_idx > 1 or len(batch) == batch_size:
+                    logger.info("      %s.%s: inserindo lote %d (%d linhas, %d no total)...",
+                                schema, table, batch_idx, len(batch), total_rows)
+                if self.commit_size and uncommitted_rows >= self.commit_size:
+                    connection.commit()
+                    uncommitted_rows = 0
+            if uncommitted_rows:
+                connection.commit()
+                if batch_idx > 1:
+                    logger.info("      Ô£ô %s.%s: commit realizado", schema, table)
+        return total_rows
 
-    @staticmethod
-    def _table_exists(connection: cx_Oracle.Connection, schema: str, table: str) -> bool:
+    def _load_target_tables(self, connection: cx_Oracle.Connection, schema: str) -> None:
+        """Carrega de uma vez as tabelas do schema no destino para _table_exists."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT table_name FROM all_tables WHERE owner = :owner",
+                owner=schema,
+            )
+            self._target_tables[schema] = {name for (name,) in cursor}
+
+    def _set_table_exists(self, schema: str, table: str, exists: bool) -> None:
+        tables = self._target_tables.get(schema)
+        if tables is not None:
+            if exists:
+                tables.add(table.upper())
+            else:
+                tables.discard(table.upper())
+
+    def _table_exists(self, connection: cx_Oracle.Connection, schema: str, table: str) -> bool:
         """Verifica se uma tabela existe no banco de destino"""
+        tables = self._target_tables.get(schema)
+        if tables is not None:
+            return table.upper() in tables
+        
         cursor = connection.cursor()
         try:
             cursor.execute(
@@ -391,7 +996,7 @@ class OracleExporter:
                 FROM all_tables
                 WHERE owner = :owner AND table_name = :table_name
                 """,
-                owner=schema.upper(),
+                owner=schema,
                 table_name=table.upper(),
             )
             count, = cursor.fetchone()
@@ -401,18 +1006,19 @@ class OracleExporter:
         finally:
             cursor.close()
 
-    @staticmethod
-    def _drop_table(connection: cx_Oracle.Connection, schema: str, table: str) -> bool:
+    def _drop_table(self, connection: cx_Oracle.Connection, schema: str, table: str) -> bool:
         """
-        Remove (DROP) uma tabela se ela existir.
+        Remove (DROP) uma tabela se ela existir, em um ├║nico round-trip: o bloco
+        tenta o DROP e ignora apenas o ORA-00942 (tabela inexistente).
         Retorna True se a tabela foi removida, False se n├úo existia.
         """
-        if not OracleExporter._table_exists(connection, schema, table):
-            return False
-        
-        sql = f'DROP TABLE {schema}.{table} CASCADE CONSTRAINTS'
         try:
-            execute_non_query(connection, sql)
+            with connection.cursor() as cursor:
+                dropped = cursor.var(int)
+                cursor.execute(_DROP_TABLE_BLOCK, owner=schema, table_name=table, dropped=dropped)
+            self._set_table_exists(schema, table, False)
+            if not dropped.getvalue():
+                return False
             logger.info("    Tabela %s.%s removida (DROP)", schema, table)
             return True
         except cx_Oracle.DatabaseError as exc:
@@ -422,6 +1028,7 @@ class OracleExporter:
             try:
                 sql = f'DROP TABLE {schema}.{table}'
                 execute_non_query(connection, sql)
+                self._set_table_exists(schema, table, False)
                 logger.info("    Tabela %s.%s removida (DROP sem CASCADE)", schema, table)
                 return True
             except Exception as e2:
@@ -434,7 +1041,7 @@ class OracleExporter:
         Obt├®m o DDL de um package ou package body a partir de ALL_SOURCE.
         ├Ütil quando DBMS_METADATA retorna DDL truncado ou inv├ílido.
         """
-        cursor = connection.cursor()
+        cursor = _catalog_cursor(connection)
         try:
             # Determinar o tipo correto para ALL_SOURCE
             if object_type == "PACKAGE_BODY":
@@ -451,25 +1058,23 @@ class OracleExporter:
                   AND type = :type
                 ORDER BY line
                 """,
-                owner=schema.upper(),
+                owner=schema,
                 name=package_name.upper(),
                 type=type_filter,
             )
             
-            lines = [row[0] for row in cursor]
-            ddl = "".join(lines)
+            ddl = "".join(text for (text,) in cursor)
             
-            if not ddl or len(ddl.strip()) < 10:
+            if _looks_truncated(ddl):
                 raise ValueError(f"DDL obtido de ALL_SOURCE est├í vazio ou muito curto para {schema}.{package_name}")
             
             return ddl
         finally:
             cursor.close()
 
-    @staticmethod
-    def _truncate_target_table(connection: cx_Oracle.Connection, schema: str, table: str) -> None:
+    def _truncate_target_table(self, connection: cx_Oracle.Connection, schema: str, table: str) -> None:
         # Verificar se a tabela existe antes de tentar truncar
-        if not OracleExporter._table_exists(connection, schema, table):
+        if not self._table_exists(connection, schema, table):
             logger.error("    Ô£ù ERRO: Tabela %s.%s n├úo existe no destino! N├úo ├® poss├¡vel copiar dados.", schema, table)
             raise ValueError(f"Tabela {schema}.{table} n├úo existe no destino. Execute a c├│pia de DDL primeiro.")
         
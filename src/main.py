@@ -1,11 +1,36 @@
 import argparse
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
 
 from .config import ProjectConfig
 from .db_utils import test_connection
-from .exporter import OracleExporter
-from .validator import OracleValidator
+
+
+# Moldura dos t├¡tulos de comando, montada uma vez
+_BANNER_TOP = "Ôòö" + "ÔòÉ" * 68 + "Ôòù"
+_BANNER_MID = "Ôòæ{:^68}Ôòæ"
+_BANNER_BOTTOM = "ÔòÜ" + "ÔòÉ" * 68 + "ÔòØ"
+
+
+def _batch_size_arg(value: str) -> int | str:
+    """Tipo do --batch-size: n├║mero de linhas positivo ou "auto"."""
+    if value.lower() == "auto":
+        return "auto"
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"valor inv├ílido: {value!r} (use um inteiro positivo ou 'auto')")
+    return size
+
+
+def _split_patterns(value: str) -> tuple[str, ...]:
+    """Lista separada por v├¡rgula (--tables, --exclude-tables) em padr├Áes n├úo vazios."""
+    return tuple(pattern for pattern in (part.strip() for part in value.split(",")) if pattern)
 
 
 logging.basicConfig(
@@ -14,6 +39,61 @@ logging.basicConfig(
 )
 
 
+def _map_with_held_logs(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    thread_name_prefix: str,
+) -> list[Any]:
+    """
+    Executa func(item) em paralelo para cada item, segurando os registros de log
+    de cada execu├º├úo e emitindo-os em bloco, na ordem dos itens. Os registros de
+    todas as execu├º├Áes s├úo emitidos mesmo se alguma falhar; a primeira exce├º├úo ├®
+    relan├ºada depois disso.
+    """
+    # Registros segurados por thread em execu├º├úo; um ├║nico filtro atende todas
+    held: dict[int, list[logging.LogRecord]] = {}
+    
+    def hold(record: logging.LogRecord) -> bool:
+        records = held.get(threading.get_ident())
+        if records is None:
+            return True
+        # Com v├írios handlers o mesmo registro passa uma vez por cada um
+        if not records or records[-1] is not record:
+            records.append(record)
+        return False
+    
+    def run(item: Any) -> tuple[Any, list[logging.LogRecord], Exception | None]:
+        thread_id = threading.get_ident()
+        records = held[thread_id] = []
+        try:
+            return func(item), records, None
+        except Exception as exc:
+            return None, records, exc
+        finally:
+            del held[thread_id]
+    
+    results = []
+    error = None
+    handlers = list(logging.getLogger().handlers)
+    for handler in handlers:
+        handler.addFilter(hold)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix) as executor:
+            for result, records, exc in executor.map(run, items):
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+                if error is None:
+                    error = exc
+                results.append(result)
+    finally:
+        for handler in handlers:
+            handler.removeFilter(hold)
+    if error is not None:
+        raise error
+    return results
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Exporta dados de um Oracle 11g para 9i e valida a c├│pia.",
@@ -21,13 +101,66 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     copy_parser = subparsers.add_parser("copy", help="Copiar dados do 11g para o 9i")
+    copy_parser.set_defaults(func=handle_copy)
     copy_parser.add_argument("--schemas", help="Lista de schemas separados por v├¡rgula", default="")
-    copy_parser.add_argument("--batch-size", type=int, default=500, help="Tamanho do lote de inser├º├úo")
+    copy_parser.add_argument(
+        "--batch-size",
+        type=_batch_size_arg,
+        default=None,
+        help=(
+            "Tamanho fixo do lote de inser├º├úo, ou 'auto' para ajust├í-lo pela vaz├úo de cada tabela; "
+            "sem ele, cada tabela usa o que couber em ~16 MB pela largura da linha (m├¡nimo 500)"
+        ),
+    )
+    copy_parser.add_argument(
+        "--commit-size",
+        type=int,
+        default=0,
+        help="Linhas inseridas entre commits dentro de uma tabela (0 = um commit por tabela)",
+    )
 
     validate_parser = subparsers.add_parser("validate", help="Validar dados copiados")
+    validate_parser.set_defaults(func=handle_validate)
     validate_parser.add_argument("--schemas", help="Lista de schemas separados por v├¡rgula", default="")
+    validate_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Schemas validados em paralelo, cada um com suas pr├│prias sess├Áes (1 = sequencial)",
+    )
+    validate_parser.add_argument(
+        "--count-mode",
+        choices=("exact", "stats"),
+        default="exact",
+        help="Contagem de linhas: exact (COUNT(*)) ou stats (NUM_ROWS das estat├¡sticas, com COUNT(*) s├│ nas diverg├¬ncias)",
+    )
+    validate_parser.add_argument(
+        "--tables",
+        default="",
+        help="Padr├Áes (fnmatch) das tabelas a contar, separados por v├¡rgula (ex: CLI_*,PED_*)",
+    )
+    validate_parser.add_argument(
+        "--exclude-tables",
+        default="",
+        help="Padr├Áes (fnmatch) das tabelas a n├úo contar, separados por v├¡rgula (ex: TMP_*,LOG_*)",
+    )
+    validate_parser.add_argument(
+        "--max-count-rows",
+        type=int,
+        default=None,
+        help=(
+            "Tabelas com mais linhas que isso (estimativa pelo NUM_ROWS da origem) n├úo s├úo contadas; "
+            "ficam listadas como n├úo verificadas"
+        ),
+    )
+    validate_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Listar tamb├®m cada tabela com contagem OK (por padr├úo s├│ o total por schema)",
+    )
 
     test_parser = subparsers.add_parser("test", help="Testar conex├Áes com os bancos")
+    test_parser.set_defaults(func=handle_test)
     test_parser.add_argument("--source", action="store_true", help="Testar apenas conex├úo com banco 11g (origem)")
     test_parser.add_argument("--target", action="store_true", help="Testar apenas conex├úo com banco 9i (destino)")
 
@@ -35,16 +168,26 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def handle_copy(args: argparse.Namespace) -> None:
+    # Importados s├│ aqui: exporter e validator carregam o cx_Oracle (e o Oracle
+    # Client) ao serem importados, o que --help e test n├úo precisam
+    from .exporter import OracleExporter
+    
     logger = logging.getLogger(__name__)
     logger.info("")
-    logger.info("Ôòö" + "ÔòÉ" * 68 + "Ôòù")
-    logger.info("Ôòæ" + " " * 20 + "COMANDO: COPY" + " " * 34 + "Ôòæ")
-    logger.info("ÔòÜ" + "ÔòÉ" * 68 + "ÔòØ")
+    logger.info("%s\n%s\n%s", _BANNER_TOP, _BANNER_MID.format("COMANDO: COPY"), _BANNER_BOTTOM)
     logger.info("")
     
     try:
         config = ProjectConfig.load(args.schemas)
-        exporter = OracleExporter(config.source, config.target, batch_size=args.batch_size)
+        if args.batch_size == "auto":
+            exporter = OracleExporter(
+                config.source,
+                config.target,
+                adaptive_batch=True,
+                commit_size=args.commit_size,
+            )
+        else:
+            exporter = OracleExporter(config.source, config.target, batch_size=args.batch_size, commit_size=args.commit_size)
         exporter.copy(config.schemas)
         logger.info("")
         logger.info("Ô£ô Opera├º├úo de c├│pia finalizada com sucesso!")
@@ -55,17 +198,37 @@ def handle_copy(args: argparse.Namespace) -> None:
 
 
 def handle_validate(args: argparse.Namespace) -> None:
+    from .validator import OracleValidator, ValidationReport
+    
     logger = logging.getLogger(__name__)
     logger.info("")
-    logger.info("Ôòö" + "ÔòÉ" * 68 + "Ôòù")
-    logger.info("Ôòæ" + " " * 15 + "COMANDO: VALIDATE" + " " * 33 + "Ôòæ")
-    logger.info("ÔòÜ" + "ÔòÉ" * 68 + "ÔòØ")
+    logger.info("%s\n%s\n%s", _BANNER_TOP, _BANNER_MID.format("COMANDO: VALIDATE"), _BANNER_BOTTOM)
     logger.info("")
     
+    if args.verbose:
+        logging.getLogger(OracleValidator.__module__).setLevel(logging.DEBUG)
+    
     try:
         config = ProjectConfig.load(args.schemas)
-        validator = OracleValidator(config.source, config.target)
-        report = validator.validate(config.schemas)
+        validator = OracleValidator(
+            config.source,
+            config.target,
+            count_mode=args.count_mode,
+            include_tables=_split_patterns(args.tables),
+            exclude_tables=_split_patterns(args.exclude_tables),
+            max_count_rows=args.max_count_rows,
+        )
+        jobs = min(args.jobs, len(config.schemas))
+        if jobs > 1:
+            # Cada validate() pega suas pr├│prias sess├Áes dos pools de origem e destino
+            logger.info("Validando at├® %d schemas em paralelo", jobs)
+            # Os logs de cada schema saem em bloco, na ordem dos schemas, sem intercalar
+            reports = _map_with_held_logs(
+                lambda schema: validator.validate([schema]), config.schemas, jobs, "validator-schema"
+            )
+            report = ValidationReport.merge(reports)
+        else:
+            report = validator.validate(config.schemas)
         
         logger.info("=" * 70)
         logger.info("RESUMO DA VALIDA├ç├âO")
@@ -89,34 +252,18 @@ def handle_validate(args: argparse.Namespace) -> None:
             logger.error("Detalhes das diverg├¬ncias:")
             logger.error("")
             
-            if report.tables.mismatches:
-                logger.error("  TABELAS:")
-                for mismatch in report.tables.mismatches:
-                    logger.error("    ÔÇó %s", mismatch)
-            else:
-                logger.info("  TABELAS: OK")
-            
-            if report.synonyms.mismatches:
-                logger.error("  SIN├öNIMOS:")
-                for mismatch in report.synonyms.mismatches:
-                    logger.error("    ÔÇó %s", mismatch)
-            else:
-                logger.info("  SIN├öNIMOS: OK")
-            
-            if report.grants.mismatches:
-                logger.error("  GRANTS:")
-                for mismatch in report.grants.mismatches:
-                    logger.error("    ÔÇó %s", mismatch)
-            else:
-                logger.info("  GRANTS: OK")
-            
-            for obj_type, detail in report.objects.items():
+            sections = [
+                ("TABELAS", report.tables),
+                ("SIN├öNIMOS", report.synonyms),
+                ("GRANTS", report.grants),
+                *((obj_type.upper(), detail) for obj_type, detail in report.objects.items()),
+            ]
+            for title, detail in sections:
                 if detail.mismatches:
-                    logger.error("  %s:", obj_type.upper())
-                    for mismatch in detail.mismatches:
-                        logger.error("    ÔÇó %s", mismatch)
+                    # Uma mensagem por se├º├úo, com uma linha por diverg├¬ncia
+                    logger.error("  %s:\n%s", title, "\n".join(f"    ÔÇó {mismatch}" for mismatch in detail.mismatches))
                 else:
-                    logger.info("  %s: OK", obj_type.upper())
+                    logger.info("  %s: OK", title)
             
             logger.error("")
             logger.error("=" * 70)
@@ -130,9 +277,7 @@ def handle_validate(args: argparse.Namespace) -> None:
 def handle_test(args: argparse.Namespace) -> None:
     logger = logging.getLogger(__name__)
     logger.info("")
-    logger.info("Ôòö" + "ÔòÉ" * 68 + "Ôòù")
-    logger.info("Ôòæ" + " " * 18 + "COMANDO: TEST CONNECTION" + " " * 27 + "Ôòæ")
-    logger.info("ÔòÜ" + "ÔòÉ" * 68 + "ÔòØ")
+    logger.info("%s\n%s\n%s", _BANNER_TOP, _BANNER_MID.format("COMANDO: TEST CONNECTION"), _BANNER_BOTTOM)
     logger.info("")
     
     try:
@@ -141,25 +286,29 @@ def handle_test(args: argparse.Namespace) -> None:
         test_source = not args.target or args.source
         test_target = not args.source or args.target
         
-        results = []
-        
+        tests = []
         if test_source:
-            logger.info("=" * 70)
-            logger.info("TESTE DE CONEX├âO - BANCO ORIGEM (11g)")
-            logger.info("=" * 70)
-            logger.info("")
-            result_source = test_connection(config.source, "Banco Origem (11g)")
-            results.append(result_source)
-            logger.info("")
-        
+            tests.append(("TESTE DE CONEX├âO - BANCO ORIGEM (11g)", config.source, "Banco Origem (11g)"))
         if test_target:
+            tests.append(("TESTE DE CONEX├âO - BANCO DESTINO (9i)", config.target, "Banco Destino (9i)"))
+        
+        def run_test(title: str, db_config, label: str) -> dict:
             logger.info("=" * 70)
-            logger.info("TESTE DE CONEX├âO - BANCO DESTINO (9i)")
+            logger.info(title)
             logger.info("=" * 70)
             logger.info("")
-            result_target = test_connection(config.target, "Banco Destino (9i)")
-            results.append(result_target)
+            result = test_connection(db_config, label)
             logger.info("")
+            return result
+        
+        # O Oracle Client ├® carregado uma vez por processo: com clients diferentes
+        # (ex: 19c na origem e 11.2 no destino), os testes rodam em sequ├¬ncia e na
+        # ordem de sempre, para o da origem ser configurado primeiro
+        if len(tests) > 1 and len({db_config.client_path for _, db_config, _ in tests}) == 1:
+            # Mesmo client: os testes rodam juntos e os logs de cada um saem em bloco, em ordem
+            results = _map_with_held_logs(lambda test: run_test(*test), tests, len(tests), "test-connection")
+        else:
+            results = [run_test(*test) for test in tests]
         
         # Resumo final
         logger.info("=" * 70)
@@ -170,19 +319,22 @@ def handle_test(args: argparse.Namespace) -> None:
         all_success = True
         for result in results:
             status = "Ô£ô SUCESSO" if result["success"] else "Ô£ù FALHOU"
-            logger.info("%s - %s", status, result["label"])
-            logger.info("  DSN: %s", result["dsn"])
-            logger.info("  Usu├írio: %s", result["user"])
-            
+            # Um bloco por resultado, em uma ├║nica chamada ao logger
+            lines = [
+                f"{status} - {result['label']}",
+                f"  DSN: {result['dsn']}",
+                f"  Usu├írio: {result['user']}",
+            ]
             if result["success"]:
                 db_info = result["database_info"]
-                logger.info("  Vers├úo: %s", db_info.get("version", "N/A"))
-                logger.info("  Banco: %s", db_info.get("database_name", "N/A"))
+                lines.append(f"  Vers├úo: {db_info.get('version', 'N/A')}")
+                lines.append(f"  Banco: {db_info.get('database_name', 'N/A')}")
+                logger.info("%s\n", "\n".join(lines))
             else:
                 error = result["error"]
-                logger.error("  Erro: %s (c├│digo: %s)", error.get("message", "Desconhecido"), error.get("code", "N/A"))
+                lines.append(f"  Erro: {error.get('message', 'Desconhecido')} (c├│digo: {error.get('code', 'N/A')})")
+                logger.error("%s\n", "\n".join(lines))
                 all_success = False
-            logger.info("")
         
         if all_success:
             logger.info("Ô£ôÔ£ôÔ£ô TODAS AS CONEX├òES TESTADAS COM SUCESSO Ô£ôÔ£ôÔ£ô")
@@ -201,13 +353,7 @@ def handle_test(args: argparse.Namespace) -> None:
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-
-    if args.command == "copy":
-        handle_copy(args)
-    elif args.command == "validate":
-        handle_validate(args)
-    elif args.command == "test":
-        handle_test(args)
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,13 @@ Usando Oracle Client do Forms 4.5 (C:\ORAWIN95)
 VERSÃO COM LIMPEZA FORÇADA DO PATH
 """
 import os
+import re
 import sys
 
+# Entradas do PATH de algum Oracle Client ('ora' já cobre 'oracle'), exceto o ORAWIN95
+_ORACLE_PATH_RE = re.compile(r'ora|instant', re.IGNORECASE)
+_KEEP_PATH_RE = re.compile(r'orawin95', re.IGNORECASE)
+
 print("=" * 70)
 print("CONFIGURAÇÃO FORÇADA - ORACLE FORMS 4.5 (ORAWIN95)")
 print("=" * 70)
@@ -24,11 +29,10 @@ cleaned_paths = []
 removed_paths = []
 
 for path in path_parts:
-    path_lower = path.lower()
     # Remover QUALQUER coisa com 'oracle' ou 'instant'
     # EXCETO se for ORAWIN95
-    if any(keyword in path_lower for keyword in ['oracle', 'instant', 'ora']):
-        if 'orawin95' in path_lower:
+    if _ORACLE_PATH_RE.search(path):
+        if _KEEP_PATH_RE.search(path):
             cleaned_paths.append(path)
             print(f"  ✓ Mantido: {path}")
         else:
@@ -68,23 +72,28 @@ print(f"✓ Oracle Home: {oracle_home}")
 print(f"✓ Oracle Bin: {oracle_bin}")
 print()
 
+# Uma única leitura do diretório serve para os arquivos críticos e os ora*.dll;
+# nomes em minúsculas, já que no Windows a comparação não diferencia caixa
+# (instalações antigas do ORAWIN95 costumam ter nomes como OCI.DLL)
+with os.scandir(oracle_bin) as entries:
+    bin_files = {entry.name.lower() for entry in entries}
+
 # Verificar arquivos críticos
 print("Verificando arquivos do Oracle Client:")
 critical_files = ['oci.dll', 'sqlnet.dll', 'ifrun45.exe']
 all_ok = True
 
 for file in critical_files:
-    file_path = os.path.join(oracle_bin, file)
-    exists = os.path.exists(file_path)
+    exists = file in bin_files
     status = "✓" if exists else "✗"
     print(f"  {status} {file}")
     if not exists and file != 'ifrun45.exe':
         all_ok = False
 
-# Procurar ora*.dll
-ora_dlls = [f for f in os.listdir(oracle_bin) if f.startswith('ora') and f.endswith('.dll')]
-if ora_dlls:
-    print(f"  ✓ {len(ora_dlls)} arquivos ora*.dll encontrados")
+# Procurar ora*.dll (só a contagem é exibida)
+ora_dll_count = sum(1 for name in bin_files if name.startswith('ora') and name.endswith('.dll'))
+if ora_dll_count:
+    print(f"  ✓ {ora_dll_count} arquivos ora*.dll encontrados")
 else:
     print(f"  ⚠️ Nenhum ora*.dll encontrado")
     all_ok = False
@@ -97,16 +106,15 @@ if not all_ok:
     print()
 
 # Adicionar ORAWIN95 NO INÍCIO do PATH limpo
-new_path = oracle_bin + os.pathsep + os.pathsep.join(cleaned_paths)
+new_path = os.pathsep.join([oracle_bin, *cleaned_paths])
 
-# Configurar variáveis de ambiente
-os.environ['PATH'] = new_path
-os.environ['ORACLE_HOME'] = oracle_home
-os.environ['TNS_ADMIN'] = os.path.join(oracle_home, 'network', 'admin')
+# Configurar variáveis de ambiente (uma escrita por variável, sem reler os.environ)
+tns_admin = os.path.join(oracle_home, 'network', 'admin')
+os.environ.update(PATH=new_path, ORACLE_HOME=oracle_home, TNS_ADMIN=tns_admin)
 
 print("Variáveis de ambiente configuradas:")
-print(f"  ORACLE_HOME = {os.environ['ORACLE_HOME']}")
-print(f"  TNS_ADMIN = {os.environ['TNS_ADMIN']}")
+print(f"  ORACLE_HOME = {oracle_home}")
+print(f"  TNS_ADMIN = {tns_admin}")
 print(f"  PATH (primeiro) = {oracle_bin}")
 print()
 
@@ -250,20 +258,23 @@ try:
     print("3. Schema Info:")
     print("-" * 70)
     try:
-        cursor.execute("SELECT COUNT(*) FROM user_tables")
-        count = cursor.fetchone()
-        print(f"   Tabelas: {count[0]}")
-        
-        if count[0] > 0:
-            cursor.execute("""
-                SELECT table_name 
-                FROM user_tables 
-                WHERE ROWNUM <= 5
+        # Total e as 5 primeiras em um único round-trip (o COUNT analítico é
+        # calculado antes do ROWNUM, então é o total do schema)
+        cursor.execute("""
+            SELECT table_name, total
+            FROM (
+                SELECT table_name, COUNT(*) OVER () AS total
+                FROM user_tables
                 ORDER BY table_name
-            """)
-            tables = cursor.fetchall()
+            )
+            WHERE ROWNUM <= 5
+        """)
+        tables = cursor.fetchall()
+        print(f"   Tabelas: {tables[0][1] if tables else 0}")
+        
+        if tables:
             print(f"   Primeiras 5:")
-            for table, in tables:
+            for table, _ in tables:
                 print(f"     - {table}")
     except Exception as e:
         print(f"   (Erro: {e})")
@@ -302,26 +313,28 @@ import sys
 # ============================================================================
 # FORÇAR USO DO ORACLE FORMS 4.5 (ORAWIN95)
 # ============================================================================
+_ORAWIN95_CONFIGURED = False
+
 def _force_orawin95_client():
     """
     Remove outros Oracle Clients do PATH e força uso do ORAWIN95
+    (uma única vez por processo, mesmo se chamada de novo)
     """
-    original_path = os.environ.get('PATH', '')
-    path_parts = original_path.split(os.pathsep)
+    global _ORAWIN95_CONFIGURED
+    if _ORAWIN95_CONFIGURED:
+        return
+    _ORAWIN95_CONFIGURED = True
     
-    # Limpar PATH
-    cleaned_paths = []
-    for path in path_parts:
-        path_lower = path.lower()
-        if any(kw in path_lower for kw in ['oracle', 'instant', 'ora']):
-            if 'orawin95' in path_lower:
-                cleaned_paths.append(path)
-        else:
-            cleaned_paths.append(path)
+    # Limpar PATH: mantém o que não é Oracle ('ora' cobre 'oracle') e o ORAWIN95
+    cleaned_paths = [
+        path for path in os.environ.get('PATH', '').split(os.pathsep)
+        if 'orawin95' in (path_lower := path.lower())
+        or not any(kw in path_lower for kw in ('ora', 'instant'))
+    ]
     
     # Adicionar ORAWIN95 no início
     orawin95_bin = r'C:\\ORAWIN95\\bin'
-    new_path = orawin95_bin + os.pathsep + os.pathsep.join(cleaned_paths)
+    new_path = os.pathsep.join([orawin95_bin, *cleaned_paths])
     
     os.environ['PATH'] = new_path
     os.environ['ORACLE_HOME'] = r'C:\\ORAWIN95'
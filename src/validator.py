@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List
+from fnmatch import fnmatchcase
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 import cx_Oracle
 
@@ -11,10 +15,27 @@ from .db_utils import oracle_connection
 
 
 logger = logging.getLogger(__name__)
-OBJECT_TYPES = ["VIEW", "TRIGGER", "PROCEDURE", "FUNCTION"]
+OBJECT_TYPES: tuple[str, ...] = ("VIEW", "TRIGGER", "PROCEDURE", "FUNCTION")
 
+# Threads que executam as consultas no destino enquanto a origem ├® consultada
+# na thread chamadora (ver _on_both); compartilhadas entre valida├º├Áes paralelas
+_target_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="validator-target")
 
-@dataclass
+# Tipos de OBJECT_TYPES para o IN da consulta ├║nica de _fetch_objects
+_OBJECT_TYPES_SQL = ", ".join("'%s'" % obj_type for obj_type in OBJECT_TYPES)
+
+# Linhas por round-trip nas consultas de dicion├írio (tabelas, nomes, grants)
+CATALOG_FETCH_ARRAYSIZE = 5000
+
+# Modos de contagem de linhas: "exact" (COUNT(*)) ou "stats" (ALL_TABLES.NUM_ROWS,
+# com COUNT(*) para tabelas sem estat├¡sticas e para confirmar as diverg├¬ncias)
+COUNT_MODES = ("exact", "stats")
+
+# Tabelas contadas por consulta (SELECT COUNT(*) ... UNION ALL ...) em _count_all_rows
+COUNT_CHUNK_SIZE = 100
+
+
+@dataclass(slots=True)
 class ValidationDetail:
     category: str
     mismatches: List[str] = field(default_factory=list)
@@ -23,7 +44,7 @@ class ValidationDetail:
         return not self.mismatches
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     tables: ValidationDetail
     synonyms: ValidationDetail
@@ -38,14 +59,98 @@ class ValidationReport:
             and all(detail.ok() for detail in self.objects.values())
         )
 
+    @classmethod
+    def merge(cls, reports: Iterable[ValidationReport]) -> ValidationReport:
+        """Junta em um s├│ os relat├│rios de schemas validados separadamente (em ordem)."""
+        merged = cls(
+            tables=ValidationDetail(category="tables"),
+            synonyms=ValidationDetail(category="SYNONYM"),
+            grants=ValidationDetail(category="grants"),
+            objects={obj_type: ValidationDetail(category=obj_type.lower()) for obj_type in OBJECT_TYPES},
+        )
+        for report in reports:
+            merged.tables.mismatches.extend(report.tables.mismatches)
+            merged.synonyms.mismatches.extend(report.synonyms.mismatches)
+            merged.grants.mismatches.extend(report.grants.mismatches)
+            for obj_type, detail in report.objects.items():
+                merged.objects.setdefault(obj_type, ValidationDetail(category=detail.category)).mismatches.extend(detail.mismatches)
+        return merged
+
+
+def _owners_in(owners: Iterable[str]) -> tuple[str, dict[str, str]]:
+    """Placeholders (":o0, :o1, ...") e binds para owner IN (...), um por schema."""
+    binds = {f"o{idx}": owner for idx, owner in enumerate(owners)}
+    return ", ".join(f":{name}" for name in binds), binds
+
+
+def _partition(source: set, target: set) -> tuple[set, set]:
+    """
+    (faltando no destino, extras no destino), calculados a partir da interse├º├úo
+    feita uma s├│ vez. Conjuntos iguais (o caso comum ap├│s uma c├│pia) saem na
+    compara├º├úo direta, sem montar a interse├º├úo.
+    """
+    if source == target:
+        return set(), set()
+    common = source & target
+    missing = source - common if len(common) < len(source) else set()
+    extra = target - common if len(common) < len(target) else set()
+    return missing, extra
+
+
+def _is_valid_ident(name: str) -> bool:
+    """
+    Se name pode ser interpolado entre aspas duplas no SQL das contagens: as
+    aspas respeitam mai├║sculas e min├║sculas do dicion├írio e deixam o texto do
+    SQL igual a cada execu├º├úo; nomes com aspas ou acima de 30 caracteres n├úo
+    s├úo identificadores Oracle.
+    """
+    return bool(name) and len(name) <= 30 and '"' not in name and "\x00" not in name
+
+
+def _catalog_cursor(connection: cx_Oracle.Connection) -> cx_Oracle.Cursor:
+    """Cursor para as consultas de dicion├írio, lidas em lotes de CATALOG_FETCH_ARRAYSIZE."""
+    cursor = connection.cursor()
+    cursor.arraysize = CATALOG_FETCH_ARRAYSIZE
+    # prefetchrows s├│ existe no cx_Oracle 8.0+
+    if hasattr(cursor, "prefetchrows"):
+        cursor.prefetchrows = CATALOG_FETCH_ARRAYSIZE + 1
+    return cursor
+
 
 class OracleValidator:
-    def __init__(self, source: OracleConfig, target: OracleConfig):
+    def __init__(
+        self,
+        source: OracleConfig,
+        target: OracleConfig,
+        count_mode: str = "exact",
+        include_tables: Iterable[str] = (),
+        exclude_tables: Iterable[str] = (),
+        max_count_rows: int | None = None,
+    ):
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Modo de contagem inv├ílido: {count_mode} (use {', '.join(COUNT_MODES)})")
         self.source = source
         self.target = target
+        self.count_mode = count_mode
+        # Padr├Áes fnmatch (ex: "TMP_*") sobre os nomes das tabelas, em mai├║sculas como no dicion├írio
+        self.include_tables = tuple(pattern.upper() for pattern in include_tables)
+        self.exclude_tables = tuple(pattern.upper() for pattern in exclude_tables)
+        # Tabelas com NUM_ROWS (origem) acima disso n├úo s├úo contadas, s├│ listadas como n├úo verificadas
+        self.max_count_rows = max_count_rows
 
     def validate(self, schemas: Iterable[str]) -> ValidationReport:
-        schema_list = list(schemas) or [self.source.schema or self.source.user.upper()]
+        schema_list = []
+        for schema in list(schemas) or [self.source.schema or self.source.user]:
+            # Normalizado uma vez aqui: os helpers recebem o owner j├í em mai├║sculas.
+            # Os nomes de schema s├úo interpolados (entre aspas) no SQL das contagens
+            schema = schema.upper()
+            if not _is_valid_ident(schema):
+                logger.error("Ô£ù Schema %r ignorado: nome inv├ílido", schema)
+            else:
+                schema_list.append(schema)
+        if not schema_list:
+            # Sem owners, as consultas "owner IN ()" falhariam (ORA-00936)
+            raise ValueError("Nenhum schema v├ílido para validar")
         logger.info("=" * 70)
         logger.info("INICIANDO PROCESSO DE VALIDA├ç├âO")
         logger.info("=" * 70)
@@ -57,174 +162,431 @@ class OracleValidator:
         with oracle_connection(self.source) as source_conn, oracle_connection(self.target) as target_conn:
             logger.info("Ô£ô Conex├Áes estabelecidas com sucesso")
             logger.info("")
+            # Um cursor por conex├úo para todas as consultas da valida├º├úo
+            source_cursor = _catalog_cursor(source_conn)
+            target_cursor = _catalog_cursor(target_conn)
             
-            logger.info(">>> Validando tabelas (contagem de linhas)...")
-            tables = self._validate_tables(source_conn, target_conn, schema_list)
+            if self.count_mode == "stats":
+                logger.info(">>> Validando tabelas (contagem de linhas pelas estat├¡sticas, diverg├¬ncias confirmadas com COUNT(*))...")
+            else:
+                logger.info(">>> Validando tabelas (contagem de linhas)...")
+            tables = self._validate_tables(source_cursor, target_cursor, schema_list)
             logger.info("Ô£ô Valida├º├úo de tabelas conclu├¡da")
             logger.info("")
             
             logger.info(">>> Validando sin├┤nimos...")
-            synonyms = self._compare_sets(source_conn, target_conn, schema_list, "SYNONYM", "ALL_SYNONYMS", "SYNONYM_NAME")
+            synonyms = self._compare_sets(source_cursor, target_cursor, schema_list, "SYNONYM", "ALL_SYNONYMS", "SYNONYM_NAME")
             logger.info("Ô£ô Valida├º├úo de sin├┤nimos conclu├¡da")
             logger.info("")
             
             logger.info(">>> Validando grants (permiss├Áes)...")
-            grants = self._compare_grants(source_conn, target_conn, schema_list)
+            grants = self._compare_grants(source_cursor, target_cursor, schema_list)
             logger.info("Ô£ô Valida├º├úo de grants conclu├¡da")
             logger.info("")
             
-            obj_details = {}
-            for obj_type in OBJECT_TYPES:
-                logger.info(">>> Validando %s...", obj_type.lower())
-                obj_details[obj_type] = self._compare_objects(source_conn, target_conn, schema_list, obj_type)
-                logger.info("Ô£ô Valida├º├úo de %s conclu├¡da", obj_type.lower())
-                logger.info("")
+            obj_details = self._compare_objects(source_cursor, target_cursor, schema_list)
         
         return ValidationReport(tables=tables, synonyms=synonyms, grants=grants, objects=obj_details)
 
+    @staticmethod
+    def _on_both(
+        func: Callable[..., Any],
+        source_cursor: cx_Oracle.Cursor,
+        target_cursor: cx_Oracle.Cursor,
+        *args: Any,
+    ) -> Tuple[Any, Any]:
+        """
+        Executa func(cursor, *args) na origem e no destino ao mesmo tempo (bancos
+        independentes, cada um em sua sess├úo) e devolve (origem, destino).
+        """
+        target_future = _target_executor.submit(func, target_cursor, *args)
+        try:
+            source_result = func(source_cursor, *args)
+        except BaseException:
+            # Espera o destino antes de propagar: a sess├úo n├úo pode ser liberada em uso
+            wait([target_future])
+            raise
+        return source_result, target_future.result()
+
     def _validate_tables(
         self,
-        source_conn: cx_Oracle.Connection,
-        target_conn: cx_Oracle.Connection,
+        source_cursor: cx_Oracle.Cursor,
+        target_cursor: cx_Oracle.Cursor,
         schemas: list[str],
     ) -> ValidationDetail:
         mismatches: list[str] = []
         total_tables = 0
+        db_link = self.source.db_link if self.count_mode == "exact" else None
         for schema in schemas:
-            tables = self._list_tables(source_conn, schema)
+            tables = self._select_tables(self._list_tables(source_cursor, schema))
             logger.info("  Schema %s: %d tabela(s) encontrada(s)", schema, len(tables))
+            if self.max_count_rows is not None and self.count_mode == "exact":
+                tables = self._skip_large_tables(source_cursor, schema, tables)
+            total_tables += len(tables)
+            if db_link:
+                diverging = self._count_mismatches_via_link(target_cursor, schema, tables, db_link)
+                if diverging is not None:
+                    for table in tables:
+                        if table in diverging:
+                            source_count, target_count = diverging[table]
+                            logger.warning("    Ô£ù %s.%s: origem=%d, destino=%d (DIVERG├èNCIA)", schema, table, source_count, target_count)
+                            mismatches.append(f"{schema}.{table}: origem={source_count} destino={target_count}")
+                    logger.info("    Ô£ô %d tabela(s) com contagens iguais (comparadas no destino via database link %s)",
+                                len(tables) - len(diverging), db_link)
+                    continue
+            count_rows = self._count_from_stats if self.count_mode == "stats" else self._count_all_rows
+            source_counts, target_counts = self._on_both(count_rows, source_cursor, target_cursor, schema, tables)
+            if self.count_mode == "stats":
+                # Estat├¡sticas podem estar desatualizadas: diverg├¬ncias s├úo confirmadas com COUNT(*)
+                recount = [table for table in tables if source_counts[table] != target_counts[table]]
+                if recount:
+                    logger.info("    Recontando %d tabela(s) divergente(s) pelas estat├¡sticas com COUNT(*)...", len(recount))
+                    exact_source, exact_target = self._on_both(self._count_all_rows, source_cursor, target_cursor, schema, recount)
+                    source_counts.update(exact_source)
+                    target_counts.update(exact_target)
+            # Tabela a tabela s├│ em DEBUG (validate --verbose); em INFO, um total por schema
+            log_each = logger.isEnabledFor(logging.DEBUG)
+            matching = 0
             for table in tables:
-                total_tables += 1
-                source_count = self._count_rows(source_conn, schema, table)
-                target_count = self._count_rows(target_conn, schema, table)
+                source_count = source_counts[table]
+                target_count = target_counts[table]
                 if source_count != target_count:
                     logger.warning("    Ô£ù %s.%s: origem=%d, destino=%d (DIVERG├èNCIA)", schema, table, source_count, target_count)
                     mismatches.append(f"{schema}.{table}: origem={source_count} destino={target_count}")
                 else:
-                    logger.info("    Ô£ô %s.%s: %d linha(s) (OK)", schema, table, source_count)
+                    matching += 1
+                    if log_each:
+                        logger.debug("    Ô£ô %s.%s: %d linha(s) (OK)", schema, table, source_count)
+            logger.info("    Ô£ô %d tabela(s) com contagens iguais", matching)
         logger.info("  Total: %d tabela(s) validada(s)", total_tables)
         return ValidationDetail(category="tables", mismatches=mismatches)
 
+    def _select_tables(self, tables: list[str]) -> list[str]:
+        """Aplica include_tables e exclude_tables (fnmatch) ├á lista de tabelas."""
+        if self.include_tables:
+            tables = [table for table in tables if any(fnmatchcase(table, pattern) for pattern in self.include_tables)]
+        if self.exclude_tables:
+            tables = [table for table in tables if not any(fnmatchcase(table, pattern) for pattern in self.exclude_tables)]
+        return tables
+
+    def _skip_large_tables(self, source_cursor: cx_Oracle.Cursor, schema: str, tables: list[str]) -> list[str]:
+        """
+        Tira da contagem as tabelas que, segundo ALL_TABLES.NUM_ROWS da origem, t├¬m
+        mais de max_count_rows linhas (evita o COUNT(*) completo delas) e devolve as
+        demais. As retiradas s├úo registradas como n├úo verificadas: ap├│s o TRUNCATE e
+        a recarga, as estat├¡sticas do destino n├úo servem de compara├º├úo.
+        """
+        source_cursor.execute(
+            "SELECT table_name, num_rows FROM all_tables WHERE owner = :owner AND num_rows > :max_rows",
+            owner=schema,
+            max_rows=self.max_count_rows,
+        )
+        above = dict(source_cursor)
+        large = [table for table in tables if table in above]
+        if not large:
+            return tables
+        logger.warning("    ÔÜá %d tabela(s) com mais de %d linha(s) pelas estat├¡sticas N├âO VERIFICADA(S) (--max-count-rows):",
+                       len(large), self.max_count_rows)
+        for table in large:
+            logger.warning("      %s.%s (~%d linha(s) na origem)", schema, table, above[table])
+        return [table for table in tables if table not in above]
+
     @staticmethod
-    def _list_tables(connection: cx_Oracle.Connection, schema: str) -> list[str]:
-        cursor = connection.cursor()
+    def _list_tables(cursor: cx_Oracle.Cursor, schema: str) -> list[str]:
         cursor.execute(
             """
             SELECT table_name
             FROM all_tables
             WHERE owner = :owner
             """,
-            owner=schema.upper(),
+            owner=schema,
+        )
+        tables = []
+        for (name,) in cursor:
+            if not _is_valid_ident(name):
+                logger.warning("    ÔÜá Tabela %s.%s ignorada: nome inv├ílido para o SQL", schema, name)
+            else:
+                tables.append(name)
+        return tables
+
+    @staticmethod
+    def _count_all_rows(cursor: cx_Oracle.Cursor, schema: str, tables: list[str]) -> dict[str, int]:
+        """
+        Conta as linhas das tabelas com uma consulta UNION ALL a cada
+        COUNT_CHUNK_SIZE tabelas, em vez de um round-trip por tabela. Se a consulta
+        de um grupo falhar (ex: tabela ausente no destino), conta o grupo tabela a
+        tabela com _count_rows, que levanta o erro da tabela problem├ítica.
+        """
+        counts: dict[str, int] = {}
+        for start in range(0, len(tables), COUNT_CHUNK_SIZE):
+            chunk = tables[start:start + COUNT_CHUNK_SIZE]
+            sql = " UNION ALL ".join(
+                f'SELECT {idx}, COUNT(*) FROM "{schema}"."{table}"' for idx, table in enumerate(chunk)
+            )
+            try:
+                cursor.execute(sql)
+            except cx_Oracle.DatabaseError:
+                for table in chunk:
+                    counts[table] = OracleValidator._count_rows(cursor, schema, table)
+                continue
+            for idx, count in cursor:
+                counts[chunk[int(idx)]] = int(count)
+        return counts
+
+    @staticmethod
+    def _count_mismatches_via_link(
+        cursor: cx_Oracle.Cursor,
+        schema: str,
+        tables: list[str],
+        db_link: str,
+    ) -> dict[str, tuple[int, int]] | None:
+        """
+        Conta as linhas no destino e na origem (table@db_link) na mesma consulta,
+        a cada COUNT_CHUNK_SIZE tabelas, e devolve s├│ as tabelas divergentes como
+        {tabela: (origem, destino)}. Retorna None se alguma consulta falhar (ex:
+        tabela ausente no destino); o chamador conta ent├úo pelas duas conex├Áes.
+        """
+        diverging: dict[str, tuple[int, int]] = {}
+        for start in range(0, len(tables), COUNT_CHUNK_SIZE):
+            chunk = tables[start:start + COUNT_CHUNK_SIZE]
+            counts = " UNION ALL ".join(
+                f'SELECT {idx} idx, (SELECT COUNT(*) FROM "{schema}"."{table}"@{db_link}) src, '
+                f'(SELECT COUNT(*) FROM "{schema}"."{table}") tgt FROM dual'
+                for idx, table in enumerate(chunk)
+            )
+            try:
+                cursor.execute(f"SELECT idx, src, tgt FROM ({counts}) WHERE src <> tgt")
+            except cx_Oracle.DatabaseError as exc:
+                error, = exc.args
+                logger.warning("    ÔÜá Falha ao contar via database link %s: %s (c├│digo %s); contando pelas duas conex├Áes...",
+                               db_link, error.message, error.code)
+                return None
+            for idx, source_count, target_count in cursor:
+                diverging[chunk[int(idx)]] = (int(source_count), int(target_count))
+        return diverging
+
+    @staticmethod
+    def _count_from_stats(cursor: cx_Oracle.Cursor, schema: str, tables: list[str]) -> dict[str, int]:
+        """
+        Linhas de cada tabela segundo ALL_TABLES.NUM_ROWS (├║ltima coleta de
+        estat├¡sticas), em uma consulta; tabelas sem estat├¡sticas s├úo contadas
+        com _count_all_rows. As que divergirem s├úo recontadas por _validate_tables.
+        """
+        cursor.execute(
+            "SELECT table_name, num_rows FROM all_tables WHERE owner = :owner",
+            owner=schema,
         )
-        return [name for (name,) in cursor]
+        num_rows = dict(cursor)
+        counts = {table: int(num_rows[table]) for table in tables if num_rows.get(table) is not None}
+        unknown = [table for table in tables if table not in counts]
+        if unknown:
+            counts.update(OracleValidator._count_all_rows(cursor, schema, unknown))
+        return counts
 
     @staticmethod
-    def _count_rows(connection: cx_Oracle.Connection, schema: str, table: str) -> int:
-        cursor = connection.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table}")
+    def _count_rows(cursor: cx_Oracle.Cursor, schema: str, table: str) -> int:
+        cursor.execute(f'SELECT COUNT(*) FROM "{schema}"."{table}"')
         (count,) = cursor.fetchone()
         return int(count)
 
     def _compare_sets(
         self,
-        source_conn: cx_Oracle.Connection,
-        target_conn: cx_Oracle.Connection,
+        source_cursor: cx_Oracle.Cursor,
+        target_cursor: cx_Oracle.Cursor,
         schemas: list[str],
         category: str,
         view_name: str,
         object_column: str,
     ) -> ValidationDetail:
         mismatches: list[str] = []
+        if self.source.db_link:
+            diffs = self._diff_names_via_link(target_cursor, view_name, object_column, schemas, self.source.db_link)
+            if diffs is not None:
+                for schema in schemas:
+                    logger.info("  Schema %s (comparado no destino via database link %s):", schema, self.source.db_link)
+                    missing, extra = diffs[schema]
+                    mismatches.extend(self._name_mismatches(schema, missing, extra))
+                return ValidationDetail(category=category, mismatches=mismatches)
+        # Uma consulta por banco para todos os schemas
+        source_names, target_names = self._on_both(self._fetch_names, source_cursor, target_cursor, view_name, object_column, schemas)
         for schema in schemas:
-            source_set = self._fetch_names(source_conn, view_name, object_column, schema)
-            target_set = self._fetch_names(target_conn, view_name, object_column, schema)
-            missing = source_set - target_set
-            extra = target_set - source_set
-            
-            logger.info("  Schema %s:", schema)
-            logger.info("    Origem: %d objeto(s)", len(source_set))
-            logger.info("    Destino: %d objeto(s)", len(target_set))
-            
-            if missing:
-                logger.warning("    Ô£ù Faltando no destino (%d): %s", len(missing), sorted(missing))
-                mismatches.append(f"{schema} faltando no destino: {sorted(missing)}")
-            if extra:
-                logger.warning("    ÔÜá Extras no destino (%d): %s", len(extra), sorted(extra))
-                mismatches.append(f"{schema} objetos extras no destino: {sorted(extra)}")
-            if not missing and not extra:
-                logger.info("    Ô£ô Todos os objetos presentes (OK)")
+            mismatches.extend(self._diff_names(schema, source_names[schema], target_names[schema]))
         return ValidationDetail(category=category, mismatches=mismatches)
 
     @staticmethod
-    def _fetch_names(connection: cx_Oracle.Connection, view_name: str, column: str, owner: str) -> set[str]:
-        cursor = connection.cursor()
+    def _diff_names(schema: str, source_set: set[str], target_set: set[str]) -> list[str]:
+        """Compara os nomes de um schema na origem e no destino; registra e devolve as diverg├¬ncias."""
+        missing, extra = _partition(source_set, target_set)
+        
+        logger.info("  Schema %s:", schema)
+        logger.info("    Origem: %d objeto(s)", len(source_set))
+        logger.info("    Destino: %d objeto(s)", len(target_set))
+        return OracleValidator._name_mismatches(schema, missing, extra)
+
+    @staticmethod
+    def _name_mismatches(schema: str, missing: set[str], extra: set[str]) -> list[str]:
+        """Registra e devolve as diverg├¬ncias de nomes de um schema."""
+        mismatches: list[str] = []
+        # Cada lista ├® ordenada uma vez e usada no log e na mensagem
+        if missing:
+            missing_names = sorted(missing)
+            logger.warning("    Ô£ù Faltando no destino (%d): %s", len(missing), missing_names)
+            mismatches.append(f"{schema} faltando no destino: {missing_names}")
+        if extra:
+            extra_names = sorted(extra)
+            logger.warning("    ÔÜá Extras no destino (%d): %s", len(extra), extra_names)
+            mismatches.append(f"{schema} objetos extras no destino: {extra_names}")
+        if not missing and not extra:
+            logger.info("    Ô£ô Todos os objetos presentes (OK)")
+        return mismatches
+
+    @staticmethod
+    def _diff_names_via_link(
+        cursor: cx_Oracle.Cursor,
+        view_name: str,
+        column: str,
+        owners: list[str],
+        db_link: str,
+    ) -> dict[str, tuple[set[str], set[str]]] | None:
+        """
+        (faltando, extras) por owner, calculados no destino com MINUS contra
+        view_name@db_link (database link para a origem): s├│ as diverg├¬ncias
+        trafegam at├® o cliente. Retorna None se a consulta falhar (o chamador
+        compara ent├úo os nomes das duas conex├Áes).
+        """
+        placeholders, binds = _owners_in(owners)
+        diffs: dict[str, tuple[set[str], set[str]]] = {owner: (set(), set()) for owner in binds.values()}
+        source_names = f"SELECT owner, {column} FROM {view_name}@{db_link} WHERE owner IN ({placeholders})"
+        target_names = f"SELECT owner, {column} FROM {view_name} WHERE owner IN ({placeholders})"
+        try:
+            cursor.execute(
+                f"""
+                SELECT 0, owner, {column} FROM ({source_names} MINUS {target_names})
+                UNION ALL
+                SELECT 1, owner, {column} FROM ({target_names} MINUS {source_names})
+                """,
+                binds,
+            )
+            for side, owner, name in cursor:
+                diffs[owner][side].add(name)
+        except cx_Oracle.DatabaseError as exc:
+            error, = exc.args
+            logger.warning("  ÔÜá Falha ao comparar %s via database link %s: %s (c├│digo %s); comparando pelo cliente...",
+                           view_name, db_link, error.message, error.code)
+            return None
+        return diffs
+
+    @staticmethod
+    def _fetch_names(cursor: cx_Oracle.Cursor, view_name: str, column: str, owners: list[str]) -> dict[str, set[str]]:
+        """Nomes de column em view_name por owner, para todos os owners em uma consulta."""
+        placeholders, binds = _owners_in(owners)
+        names: dict[str, set[str]] = {owner: set() for owner in binds.values()}
         cursor.execute(
             f"""
-            SELECT {column}
+            SELECT owner, {column}
             FROM {view_name}
-            WHERE owner = :owner
+            WHERE owner IN ({placeholders})
+            ORDER BY owner
             """,
-            owner=owner.upper(),
+            binds,
         )
-        return {name for (name,) in cursor}
+        # Ordenado por owner: um grupo cont├¡guo por schema, convertido em set sem loop Python por linha
+        for owner, rows in groupby(cursor.fetchall(), key=itemgetter(0)):
+            names[owner] = set(map(itemgetter(1), rows))
+        return names
 
     def _compare_grants(
         self,
-        source_conn: cx_Oracle.Connection,
-        target_conn: cx_Oracle.Connection,
+        source_cursor: cx_Oracle.Cursor,
+        target_cursor: cx_Oracle.Cursor,
         schemas: list[str],
     ) -> ValidationDetail:
         mismatches: list[str] = []
+        source_grants, target_grants = self._on_both(self._fetch_grants, source_cursor, target_cursor, schemas)
         for schema in schemas:
-            source = self._fetch_grants(source_conn, schema)
-            target = self._fetch_grants(target_conn, schema)
-            missing = source - target
-            extra = target - source
+            source = source_grants[schema]
+            target = target_grants[schema]
+            missing, extra = _partition(source, target)
             
             logger.info("  Schema %s:", schema)
             logger.info("    Origem: %d grant(s)", len(source))
             logger.info("    Destino: %d grant(s)", len(target))
             
             if missing:
-                logger.warning("    Ô£ù Grants faltantes (%d): %s", len(missing), sorted(missing))
-                mismatches.append(f"{schema} grants faltantes: {sorted(missing)}")
+                missing_grants = sorted(f"{grantee}:{privilege}:{table}" for grantee, privilege, table in missing)
+                logger.warning("    Ô£ù Grants faltantes (%d): %s", len(missing), missing_grants)
+                mismatches.append(f"{schema} grants faltantes: {missing_grants}")
             if extra:
-                logger.warning("    ÔÜá Grants extras (%d): %s", len(extra), sorted(extra))
-                mismatches.append(f"{schema} grants extras: {sorted(extra)}")
+                extra_grants = sorted(f"{grantee}:{privilege}:{table}" for grantee, privilege, table in extra)
+                logger.warning("    ÔÜá Grants extras (%d): %s", len(extra), extra_grants)
+                mismatches.append(f"{schema} grants extras: {extra_grants}")
             if not missing and not extra:
                 logger.info("    Ô£ô Todos os grants presentes (OK)")
         return ValidationDetail(category="grants", mismatches=mismatches)
 
     @staticmethod
-    def _fetch_grants(connection: cx_Oracle.Connection, schema: str) -> set[str]:
-        cursor = connection.cursor()
+    def _fetch_grants(cursor: cx_Oracle.Cursor, schemas: list[str]) -> dict[str, set[tuple[str, str, str]]]:
+        """
+        Grants (grantee, privil├®gio, tabela) por owner, para todos os schemas em uma
+        consulta; o texto "grantee:privil├®gio:tabela" s├│ ├® montado para as diverg├¬ncias.
+        """
+        placeholders, binds = _owners_in(schemas)
+        grants: dict[str, set[tuple[str, str, str]]] = {owner: set() for owner in binds.values()}
         cursor.execute(
-            """
-            SELECT grantee || ':' || privilege || ':' || table_name
+            f"""
+            SELECT owner, grantee, privilege, table_name
             FROM all_tab_privs
-            WHERE owner = :owner
+            WHERE owner IN ({placeholders})
+            ORDER BY owner
             """,
-            owner=schema.upper(),
+            binds,
         )
-        return {row[0] for row in cursor}
+        for owner, rows in groupby(cursor.fetchall(), key=itemgetter(0)):
+            grants[owner] = set(map(itemgetter(1, 2, 3), rows))
+        return grants
 
     def _compare_objects(
         self,
-        source_conn: cx_Oracle.Connection,
-        target_conn: cx_Oracle.Connection,
+        source_cursor: cx_Oracle.Cursor,
+        target_cursor: cx_Oracle.Cursor,
         schemas: list[str],
-        obj_type: str,
-    ) -> ValidationDetail:
-        detail = self._compare_sets(
-            source_conn,
-            target_conn,
-            schemas,
-            category=obj_type.lower(),
-            view_name="ALL_OBJECTS",
-            object_column="OBJECT_NAME",
-        )
-        detail.mismatches = [
-            msg for msg in detail.mismatches if obj_type.upper() in msg.upper()
-        ] or detail.mismatches
-        return detail
+    ) -> Dict[str, ValidationDetail]:
+        """
+        Compara os objetos de OBJECT_TYPES com uma ├║nica consulta ao ALL_OBJECTS
+        em cada banco (todos os tipos e schemas de uma vez), separados aqui.
+        """
+        source_objects, target_objects = self._on_both(self._fetch_objects, source_cursor, target_cursor, schemas)
+        details: Dict[str, ValidationDetail] = {}
+        for obj_type in OBJECT_TYPES:
+            category = obj_type.lower()
+            logger.info(">>> Validando %s...", category)
+            mismatches: list[str] = []
+            for schema in schemas:
+                key = (schema, obj_type)
+                mismatches.extend(self._diff_names(
+                    schema,
+                    source_objects.get(key, set()),
+                    target_objects.get(key, set()),
+                ))
+            details[obj_type] = ValidationDetail(category=category, mismatches=mismatches)
+            logger.info("Ô£ô Valida├º├úo de %s conclu├¡da", category)
+            logger.info("")
+        return details
 
+    @staticmethod
+    def _fetch_objects(cursor: cx_Oracle.Cursor, schemas: list[str]) -> dict[tuple[str, str], set[str]]:
+        """Nomes dos objetos de OBJECT_TYPES por (owner, tipo), para todos os schemas."""
+        placeholders, binds = _owners_in(schemas)
+        objects: dict[tuple[str, str], set[str]] = {}
+        cursor.execute(
+            f"""
+            SELECT owner, object_type, object_name
+            FROM all_objects
+            WHERE owner IN ({placeholders})
+              AND object_type IN ({_OBJECT_TYPES_SQL})
+            """,
+            binds,
+        )
+        for owner, obj_type, name in cursor:
+            objects.setdefault((owner, obj_type), set()).add(name)
+        return objects